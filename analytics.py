@@ -0,0 +1,504 @@
+"""
+analytics.py
+
+Cohort analytics over stored session results (see results.py):
+- Streams RESULTS_DIR/*.jsonl in chunks into columnar NumPy arrays
+- Folds every chunk into fixed-size accumulators (histograms / bincounts),
+  so result files larger than memory are fine
+- Score percentiles by career and level
+- Per-question difficulty calibration (observed vs. labelled difficulty)
+- Keyword miss heatmap per question
+- Hesitation and pace distributions
+- Writes CSV files and a single self-contained HTML report
+
+JSON parsing dominates the run time; it uses orjson when installed.
+
+Usage:
+
+    python analytics.py [results/*.jsonl ...] --out report --chunk-size 20000
+"""
+
+import os
+import csv
+import sys
+import glob
+import html
+import json
+import time
+import argparse
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:  # optional: several times faster than json for the parsing pass
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+from questions import difficulty_rank
+from results import results_dir
+
+
+VERDICTS = ("strong", "partial", "weak", "no_answer")
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Fixed histogram bins (values outside are clipped into the first / last bin)
+SCORE_BINS = np.linspace(0.0, 200.0, 801)  # final score, 0.25 wide
+HESITATION_BINS = np.arange(0, 22)          # 0, 1, ..., 20, 21+
+PACE_BINS = np.linspace(0.0, 6.0, 61)       # words / second, 0.1 wide
+
+# Questions need this many answers before they are flagged as miscalibrated
+MIN_CALIBRATION_ANSWERS = 20
+# z for the Wilson intervals compared in calibration() (95%)
+CALIBRATION_Z = 1.96
+
+
+class Vocab:
+    """Stable id for every distinct value seen across chunks."""
+
+    def __init__(self) -> None:
+        self.ids: Dict[Hashable, int] = {}
+        self.values: List[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def id(self, value: Hashable) -> int:
+        idx = self.ids.get(value)
+        if idx is None:
+            idx = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+@dataclass
+class Chunk:
+    """Columnar view of up to chunk_size sessions."""
+
+    # one row per session
+    session_group: np.ndarray
+    final_score: np.ndarray
+    # one row per answer
+    answer_group: np.ndarray
+    question: np.ndarray
+    verdict: np.ndarray
+    knowledge: np.ndarray
+    confidence: np.ndarray
+    hesitations: np.ndarray
+    pace: np.ndarray
+    # one row per missed keyword (ids into CohortAnalytics.misses)
+    miss_pair: np.ndarray
+
+
+def _bin(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Histogram bin index for every value (clipped into range)."""
+    return np.clip(np.searchsorted(edges, values, side="right") - 1, 0, len(edges) - 1)
+
+
+def _grow(arr: np.ndarray, rows: int) -> np.ndarray:
+    """Pad axis 0 with zeros up to `rows`."""
+    if arr.shape[0] >= rows:
+        return arr
+    pad = [(0, rows - arr.shape[0])] + [(0, 0)] * (arr.ndim - 1)
+    return np.pad(arr, pad)
+
+
+def _hist_percentiles(
+    hist: np.ndarray, edges: np.ndarray, pcts: Sequence[int], discrete: bool = False
+) -> np.ndarray:
+    """
+    Per-row percentiles from a (rows, bins) histogram; NaN for empty rows.
+    Values are interpolated linearly inside the bin that holds the percentile;
+    `discrete` bins hold a single integer value each and return it as is.
+    """
+    cum = hist.cumsum(axis=1)
+    total = cum[:, -1]
+    widths = np.diff(edges, append=edges[-1] + (edges[-1] - edges[-2]))
+    rows = np.arange(hist.shape[0])
+    out = np.full((hist.shape[0], len(pcts)), np.nan)
+    for j, p in enumerate(pcts):
+        target = total * (p / 100.0)
+        idx = np.argmax(cum >= np.maximum(target, 1e-9)[:, None], axis=1)
+        if discrete:
+            value = edges[idx].astype(np.float64)
+        else:
+            below = cum[rows, idx] - hist[rows, idx]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                fraction = np.clip((target - below) / hist[rows, idx], 0.0, 1.0)
+            value = edges[idx] + fraction * widths[idx]
+        out[:, j] = np.where(total > 0, value, np.nan)
+    return out
+
+
+def _wilson(
+    successes: np.ndarray, trials: np.ndarray, z: float = CALIBRATION_Z
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilson score interval (low, high) for a binomial proportion."""
+    n = np.maximum(trials, 1).astype(np.float64)
+    p = successes / n
+    denom = 1.0 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return centre - half, centre + half
+
+
+def _iter_lines(paths: Iterable[str]) -> Iterator[bytes]:
+    for path in paths:
+        with open(path, "rb") as fh:
+            yield from fh
+
+
+class CohortAnalytics:
+    """
+    Flow:
+
+    1. read_chunks(paths) -> Chunk objects (ids assigned via the vocabularies)
+    2. add(chunk)         -> fold into the accumulators, then drop the chunk
+    3. score_percentiles() / calibration() / keyword_misses() / distributions()
+    """
+
+    def __init__(self) -> None:
+        self.groups = Vocab()     # (career, level)
+        self.questions = Vocab()  # (bank_key, question text)
+        self.misses = Vocab()     # (question id, keyword)
+        self.question_difficulty: List[str] = []
+
+        self.sessions = 0
+        self.answers = 0
+        self.score_hist = np.zeros((0, len(SCORE_BINS)), dtype=np.int64)
+        # exact per-group sums (histograms only give binned values)
+        self.score_sum = np.zeros(0)
+        self.hesitation_sum = np.zeros(0)
+        self.pace_sum = np.zeros(0)
+        self.hesitation_hist = np.zeros((0, len(HESITATION_BINS)), dtype=np.int64)
+        self.pace_hist = np.zeros((0, len(PACE_BINS)), dtype=np.int64)
+        self.q_verdicts = np.zeros((0, len(VERDICTS)), dtype=np.int64)
+        self.q_knowledge = np.zeros(0)
+        self.q_score = np.zeros(0)
+        self.miss_counts = np.zeros(0, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # LOADING
+    # ------------------------------------------------------------------
+    def read_chunks(self, paths: Iterable[str], chunk_size: int) -> Iterator[Chunk]:
+        """Parse JSONL session files, `chunk_size` sessions at a time."""
+        lines = _iter_lines(paths)
+        loads = _loads
+        verdict_ids = {v: i for i, v in enumerate(VERDICTS)}
+
+        while True:
+            sessions = []
+            for line in lines:
+                try:
+                    session = loads(line)
+                except ValueError:
+                    continue  # blank or torn line from a crashed writer
+                if not isinstance(session, dict):
+                    continue  # valid JSON, but not a session record
+                sessions.append(session)
+                if len(sessions) >= chunk_size:
+                    break
+            if not sessions:
+                return
+            yield self._to_chunk(sessions, verdict_ids)
+
+    def _to_chunk(self, sessions: List[dict], verdict_ids: Dict[str, int]) -> Chunk:
+        """Sessions -> columns. Only id lookups run per answer; fields are pulled column-wise."""
+        group_id = self.groups.id
+        session_group = [group_id((s.get("career", ""), s.get("level", ""))) for s in sessions]
+
+        per_session = [
+            [a for a in s.get("answers") or () if isinstance(a, dict)] for s in sessions
+        ]
+        answers = [a for session_answers in per_session for a in session_answers]
+        answer_group = np.repeat(
+            np.asarray(session_group, dtype=np.int64),
+            [len(session_answers) for session_answers in per_session],
+        )
+        banks = [
+            s.get("bank_key") or s.get("career", "")
+            for s, session_answers in zip(sessions, per_session) for _ in session_answers
+        ]
+
+        known, question_id = self.questions.ids, self.questions.id
+        question = []
+        for bank, a in zip(banks, answers):
+            key = (bank, a.get("question", ""))
+            qid = known.get(key)
+            if qid is None:
+                qid = question_id(key)
+                self.question_difficulty.append(a.get("difficulty") or "all")
+            question.append(qid)
+
+        known_misses, miss_id = self.misses.ids, self.misses.id
+        miss_pair = []
+        for qid, a in zip(question, answers):
+            for kw in a.get("missing") or ():
+                pair = known_misses.get((qid, kw))
+                miss_pair.append(pair if pair is not None else miss_id((qid, kw)))
+
+        def column(field: str, default: float, dtype=np.float64) -> np.ndarray:
+            return np.fromiter((a.get(field, default) for a in answers), dtype, len(answers))
+
+        return Chunk(
+            session_group=np.asarray(session_group, dtype=np.int64),
+            final_score=np.fromiter((s.get("final_score", 0.0) for s in sessions), np.float64, len(sessions)),
+            answer_group=answer_group,
+            question=np.asarray(question, dtype=np.int64),
+            verdict=np.fromiter((verdict_ids.get(a.get("verdict"), 3) for a in answers), np.int64, len(answers)),
+            knowledge=column("knowledge", 0.0),
+            confidence=column("confidence", 0.0),
+            hesitations=column("hesitations", 0, np.int64),
+            pace=column("pace", 0.0),
+            miss_pair=np.asarray(miss_pair, dtype=np.int64),
+        )
+
+    # ------------------------------------------------------------------
+    # ACCUMULATION (vectorized)
+    # ------------------------------------------------------------------
+    def add(self, chunk: Chunk) -> None:
+        n_groups, n_questions = len(self.groups), len(self.questions)
+        self.score_hist = _grow(self.score_hist, n_groups)
+        self.score_sum = _grow(self.score_sum, n_groups)
+        self.hesitation_sum = _grow(self.hesitation_sum, n_groups)
+        self.pace_sum = _grow(self.pace_sum, n_groups)
+        self.hesitation_hist = _grow(self.hesitation_hist, n_groups)
+        self.pace_hist = _grow(self.pace_hist, n_groups)
+        self.q_verdicts = _grow(self.q_verdicts, n_questions)
+        self.q_knowledge = _grow(self.q_knowledge, n_questions)
+        self.q_score = _grow(self.q_score, n_questions)
+        self.miss_counts = _grow(self.miss_counts, len(self.misses))
+
+        self.sessions += chunk.session_group.size
+        self.answers += chunk.question.size
+
+        np.add.at(self.score_hist, (chunk.session_group, _bin(chunk.final_score, SCORE_BINS)), 1)
+        np.add.at(
+            self.hesitation_hist,
+            (chunk.answer_group, _bin(chunk.hesitations, HESITATION_BINS)),
+            1,
+        )
+        np.add.at(self.pace_hist, (chunk.answer_group, _bin(chunk.pace, PACE_BINS)), 1)
+        np.add.at(self.q_verdicts, (chunk.question, chunk.verdict), 1)
+
+        self.score_sum += np.bincount(chunk.session_group, chunk.final_score, minlength=n_groups)
+        self.hesitation_sum += np.bincount(chunk.answer_group, chunk.hesitations, minlength=n_groups)
+        self.pace_sum += np.bincount(chunk.answer_group, chunk.pace, minlength=n_groups)
+
+        self.q_knowledge += np.bincount(chunk.question, chunk.knowledge, minlength=n_questions)
+        self.q_score += np.bincount(
+            chunk.question, 0.7 * chunk.knowledge + 0.3 * chunk.confidence, minlength=n_questions
+        )
+        self.miss_counts += np.bincount(chunk.miss_pair, minlength=len(self.misses))
+
+    # ------------------------------------------------------------------
+    # RESULTS
+    # ------------------------------------------------------------------
+    def score_percentiles(self) -> List[Dict[str, object]]:
+        pcts = _hist_percentiles(self.score_hist, SCORE_BINS, PERCENTILES)
+        counts = self.score_hist.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = self.score_sum / counts
+        rows = []
+        for gid in sorted(range(len(self.groups)), key=lambda g: self.groups.values[g]):
+            career, level = self.groups.values[gid]
+            row: Dict[str, object] = {"career": career, "level": level, "sessions": int(counts[gid])}
+            row["mean"] = round(float(means[gid]), 2)
+            row.update({f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, pcts[gid])})
+            rows.append(row)
+        return rows
+
+    def calibration(self) -> List[Dict[str, object]]:
+        """
+        Observed difficulty per question (1 - strong rate). A question is flagged
+        when it is answered worse than the questions one level harder in its bank,
+        or better than the questions one level easier, and the Wilson intervals of
+        the two strong rates do not overlap (so sampling noise is not flagged).
+        """
+        n = self.q_verdicts.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            strong_rate = self.q_verdicts[:, 0] / n
+            no_answer_rate = self.q_verdicts[:, 3] / n
+            mean_knowledge = self.q_knowledge / n
+            mean_score = self.q_score / n
+
+        banks = np.array([bank for bank, _ in self.questions.values], dtype=object)
+        ranks = np.array([difficulty_rank(d) for d in self.question_difficulty])
+        enough = n >= MIN_CALIBRATION_ANSWERS
+
+        strong_low, strong_high = _wilson(self.q_verdicts[:, 0], n)
+
+        # Pooled strong-rate interval per (bank, rank) over questions with enough answers
+        rank_interval: Dict[Tuple[str, int], Tuple[float, float]] = {}
+        for key in set(zip(banks[enough], ranks[enough])):
+            sel = enough & (banks == key[0]) & (ranks == key[1])
+            low, high = _wilson(self.q_verdicts[sel, 0].sum(), n[sel].sum())
+            rank_interval[key] = (float(low), float(high))
+
+        rows = []
+        order = np.lexsort((-strong_rate, banks.astype(str)))
+        for qid in order:
+            bank, question = self.questions.values[qid]
+            flag = ""
+            if enough[qid]:
+                harder = rank_interval.get((bank, ranks[qid] + 1))
+                easier = rank_interval.get((bank, ranks[qid] - 1))
+                if harder is not None and strong_high[qid] < harder[0]:
+                    flag = "harder than labelled"
+                elif easier is not None and strong_low[qid] > easier[1]:
+                    flag = "easier than labelled"
+            rows.append({
+                "bank": bank,
+                "question": question,
+                "label": self.question_difficulty[qid],
+                "answers": int(n[qid]),
+                "strong_rate": round(float(strong_rate[qid]), 3),
+                "no_answer_rate": round(float(no_answer_rate[qid]), 3),
+                "mean_knowledge": round(float(mean_knowledge[qid]), 2),
+                "mean_score": round(float(mean_score[qid]), 2),
+                "observed_difficulty": round(float(1.0 - strong_rate[qid]), 3),
+                "flag": flag,
+            })
+        return rows
+
+    def keyword_misses(self) -> List[Dict[str, object]]:
+        """Miss rate of every (question, keyword) pair, worst first."""
+        if not len(self.misses):
+            return []
+        qids = np.array([qid for qid, _ in self.misses.values], dtype=np.int64)
+        keywords = [kw for _, kw in self.misses.values]
+        answered = self.q_verdicts.sum(axis=1)[qids]
+        rate = self.miss_counts / np.maximum(answered, 1)
+
+        rows = []
+        for i in np.lexsort((-rate, qids)):
+            bank, question = self.questions.values[qids[i]]
+            rows.append({
+                "bank": bank,
+                "question": question,
+                "keyword": keywords[i],
+                "misses": int(self.miss_counts[i]),
+                "answers": int(answered[i]),
+                "miss_rate": round(float(rate[i]), 3),
+            })
+        return rows
+
+    def distributions(self) -> List[Dict[str, object]]:
+        """Hesitation and pace summary per (career, level)."""
+        h_pcts = _hist_percentiles(self.hesitation_hist, HESITATION_BINS, (50, 90), discrete=True)
+        p_pcts = _hist_percentiles(self.pace_hist, PACE_BINS, (10, 50, 90))
+        answers = self.hesitation_hist.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            h_mean = self.hesitation_sum / answers
+            p_mean = self.pace_sum / answers
+
+        rows = []
+        for gid, (career, level) in enumerate(self.groups.values):
+            rows.append({
+                "career": career,
+                "level": level,
+                "answers": int(answers[gid]),
+                "hesitations_mean": round(float(h_mean[gid]), 2),
+                "hesitations_p50": float(h_pcts[gid, 0]),
+                "hesitations_p90": float(h_pcts[gid, 1]),
+                "pace_mean": round(float(p_mean[gid]), 2),
+                "pace_p10": round(float(p_pcts[gid, 0]), 2),
+                "pace_p50": round(float(p_pcts[gid, 1]), 2),
+                "pace_p90": round(float(p_pcts[gid, 2]), 2),
+            })
+        return sorted(rows, key=lambda r: (r["career"], r["level"]))
+
+
+# ---------------------------------------------------------------------------
+# REPORTS
+# ---------------------------------------------------------------------------
+
+def write_csv(path: str, rows: List[Dict[str, object]]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        if not rows:
+            return
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _html_table(rows: List[Dict[str, object]], heat: Optional[str] = None, limit: int = 500) -> str:
+    """Plain HTML table; the `heat` column gets a red background scaled by its value (0..1)."""
+    if not rows:
+        return "<p>No data.</p>"
+    head = "".join(f"<th>{html.escape(str(k))}</th>" for k in rows[0])
+    body = []
+    for row in rows[:limit]:
+        cells = []
+        for key, value in row.items():
+            style = ""
+            if key == heat and isinstance(value, float) and value == value:
+                style = f' style="background: rgba(220, 40, 40, {min(max(value, 0.0), 1.0):.2f})"'
+            cells.append(f"<td{style}>{html.escape(str(value))}</td>")
+        body.append("<tr>" + "".join(cells) + "</tr>")
+    more = f"<p>Showing {limit} of {len(rows)} rows (full data in CSV).</p>" if len(rows) > limit else ""
+    return f"<table><tr>{head}</tr>{''.join(body)}</table>{more}"
+
+
+def write_html(path: str, analytics: CohortAnalytics, sections: Dict[str, List[Dict[str, object]]]) -> None:
+    titles = {
+        "score_percentiles": ("Final score by career and level", None),
+        "calibration": ("Question difficulty calibration", "observed_difficulty"),
+        "keyword_misses": ("Keyword miss heatmap", "miss_rate"),
+        "distributions": ("Hesitation and pace", None),
+    }
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Interview cohort report</title>",
+        "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin-bottom:2em}"
+        "td,th{border:1px solid #ccc;padding:3px 8px;font-size:13px}th{background:#eee}</style>",
+        "</head><body><h1>Interview cohort report</h1>",
+        f"<p>{analytics.sessions} sessions, {analytics.answers} answers, "
+        f"generated {html.escape(time.strftime('%Y-%m-%d %H:%M'))}</p>",
+    ]
+    for name, rows in sections.items():
+        title, heat = titles[name]
+        parts.append(f"<h2>{title}</h2>{_html_table(rows, heat)}")
+    parts.append("</body></html>")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("".join(parts))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cohort analytics over stored interview sessions.")
+    parser.add_argument("paths", nargs="*", help="session .jsonl files (default: RESULTS_DIR/*.jsonl)")
+    parser.add_argument("--out", default="report", help="output folder for CSV + HTML")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="sessions held in memory at once")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or sorted(glob.glob(os.path.join(results_dir(), "*.jsonl")))
+    if not paths:
+        print("No session results found.")
+        return 1
+
+    started = time.perf_counter()
+    analytics = CohortAnalytics()
+    for chunk in analytics.read_chunks(paths, args.chunk_size):
+        analytics.add(chunk)
+
+    sections = {
+        "score_percentiles": analytics.score_percentiles(),
+        "calibration": analytics.calibration(),
+        "keyword_misses": analytics.keyword_misses(),
+        "distributions": analytics.distributions(),
+    }
+
+    os.makedirs(args.out, exist_ok=True)
+    for name, rows in sections.items():
+        write_csv(os.path.join(args.out, f"{name}.csv"), rows)
+    write_html(os.path.join(args.out, "report.html"), analytics, sections)
+
+    print(
+        f"Analyzed {analytics.sessions} sessions ({analytics.answers} answers) "
+        f"in {time.perf_counter() - started:.1f}s -> {os.path.join(args.out, 'report.html')}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
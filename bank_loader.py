@@ -0,0 +1,191 @@
+"""
+bank_loader.py
+
+BankLoader:
+- Builds immutable BankSnapshot objects (questions + difficulty / similarity indexes)
+- Base banks come from config.STRUCTURED_QUESTIONS; JSON files in BANKS_DIR
+  add or replace banks (file name = bank key, content = list of question dicts)
+- A background thread polls BANKS_DIR and rebuilds on change
+- New sessions pick up the new snapshot; running sessions keep the one they started with
+"""
+
+import os
+import re
+import json
+import glob
+import hashlib
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from questions import Question, load_bank
+from scheduler import build_difficulty_index
+from similarity import IdealAnswerIndex
+from config import STRUCTURED_QUESTIONS, BANKS_DIR, BANK_POLL_INTERVAL
+
+
+def career_slug(career: str) -> str:
+    """Bank key / file name for a free-text career ('Product Manager' -> 'product-manager')."""
+    return re.sub(r"[^a-z0-9_]+", "-", career.lower()).strip("-")
+
+
+@dataclass(frozen=True)
+class BankSnapshot:
+    """One immutable, fully indexed version of every question bank."""
+
+    version: str
+    banks: Mapping[str, Tuple[Question, ...]]
+    difficulty_index: Mapping[str, Dict[int, List[int]]]
+    similarity_index: Mapping[str, IdealAnswerIndex]
+
+
+def _read_sources(banks_dir: Optional[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """config banks, overridden / extended by every <key>.json in banks_dir."""
+    sources: Dict[str, List[Dict[str, Any]]] = dict(STRUCTURED_QUESTIONS)
+    if banks_dir is None:
+        return sources
+
+    for path in sorted(glob.glob(os.path.join(banks_dir, "*.json"))):
+        key = os.path.splitext(os.path.basename(path))[0].lower()
+        with open(path, "r", encoding="utf-8") as fh:
+            try:
+                items = json.load(fh)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}: {exc}") from exc
+        if not isinstance(items, list):
+            raise ValueError(f"{path}: expected a list of question objects")
+        for pos, item in enumerate(items):
+            problem = _check_item(item)
+            if problem:
+                raise ValueError(f"{path}: question {pos}: {problem}")
+        sources[key] = items
+    return sources
+
+
+def _check_item(item: Any) -> Optional[str]:
+    """Why `item` is not a valid question object (None if it is)."""
+    if not isinstance(item, dict):
+        return "expected an object"
+    if not isinstance(item.get("question"), str) or not item["question"]:
+        return "'question' must be a non-empty string"
+    for field in ("ideal_answer", "difficulty"):
+        if item.get(field) is not None and not isinstance(item[field], str):
+            return f"'{field}' must be a string or null"
+    keywords = item.get("keywords")
+    if keywords is not None and (
+        not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords)
+    ):
+        return "'keywords' must be a list of strings or null"
+    return None
+
+
+def build_snapshot(sequence: int, banks_dir: Optional[str]) -> BankSnapshot:
+    """Load every bank and precompute its indexes."""
+    sources = _read_sources(banks_dir)
+    digest = hashlib.sha1(
+        json.dumps(sources, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+    banks = {key: load_bank(items) for key, items in sources.items()}
+    return BankSnapshot(
+        version=f"{sequence}-{digest[:10]}",
+        banks=MappingProxyType(banks),
+        difficulty_index=MappingProxyType(
+            {key: build_difficulty_index(bank) for key, bank in banks.items()}
+        ),
+        similarity_index=MappingProxyType(
+            {key: IdealAnswerIndex([(q.question, q.ideal_answer) for q in bank]) for key, bank in banks.items()}
+        ),
+    )
+
+
+class BankLoader:
+    """
+    Flow:
+
+    1. __init__  -> build the first snapshot synchronously
+    2. start()   -> background thread polls BANKS_DIR for changes
+    3. current() -> snapshot for a new session (a single attribute read)
+    4. reload()  -> rebuild now; swaps only if the build succeeds
+    """
+
+    def __init__(self, banks_dir: str, poll_interval: float = BANK_POLL_INTERVAL) -> None:
+        self.banks_dir = banks_dir
+        self.poll_interval = poll_interval
+        self._sequence = 0
+        self._fingerprint = self._scan()
+        try:
+            self._snapshot = build_snapshot(self._sequence, banks_dir)
+        except Exception as exc:  # a bad bank file must never stop sessions
+            print(f"[Bank Loader Error] {exc}")
+            self._snapshot = build_snapshot(self._sequence, None)
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def current(self) -> BankSnapshot:
+        return self._snapshot
+
+    def _scan(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Cheap change detector: (name, mtime, size) of every bank file."""
+        entries = []
+        for path in sorted(glob.glob(os.path.join(self.banks_dir, "*.json"))):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_mtime_ns, st.st_size))
+        return tuple(entries)
+
+    def reload(self) -> bool:
+        """Rebuild from disk. Returns True if a new snapshot was published."""
+        with self._reload_lock:
+            fingerprint = self._scan()
+            try:
+                snapshot = build_snapshot(self._sequence + 1, self.banks_dir)
+            except Exception as exc:  # keep the watcher alive and the old snapshot live
+                print(f"[Bank Loader Error] {exc}")
+                self._fingerprint = fingerprint  # don't retry until the files change again
+                return False
+
+            self._fingerprint = fingerprint
+            self._sequence += 1
+            self._snapshot = snapshot  # atomic reference swap
+            print(f"[Bank Loader] Loaded question banks version {snapshot.version}")
+            return True
+
+    # ------------------------------------------------------------------
+    # BACKGROUND WATCHER
+    # ------------------------------------------------------------------
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            if self._scan() != self._fingerprint:
+                self.reload()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._watch, name="bank-loader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+_loader: Optional[BankLoader] = None
+_loader_lock = threading.Lock()
+
+
+def get_loader() -> BankLoader:
+    """Process-wide loader, created and started on first use."""
+    global _loader
+    with _loader_lock:
+        if _loader is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            _loader = BankLoader(os.path.join(base_dir, BANKS_DIR))
+            _loader.start()
+        return _loader
@@ -0,0 +1,57 @@
+"""
+bench_questions.py
+
+Memory comparison: question banks held as plain dicts vs. slotted Question records.
+
+Each "tenant" loads its own copy of every structured bank from JSON (as a
+multi-tenant service reading bank files would), so no strings are shared by
+accident. Usage:
+
+    python bench_questions.py [tenants]
+"""
+
+import sys
+import json
+import tracemalloc
+from typing import Any, Callable
+
+from config import STRUCTURED_QUESTIONS
+from questions import load_bank
+
+
+def _measure(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> None:
+    tenants = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    raw = json.dumps(STRUCTURED_QUESTIONS)
+    n_questions = sum(len(bank) for bank in STRUCTURED_QUESTIONS.values())
+
+    def as_dicts():
+        return [json.loads(raw) for _ in range(tenants)]
+
+    def as_records():
+        return [
+            {key: load_bank(bank) for key, bank in json.loads(raw).items()}
+            for _ in range(tenants)
+        ]
+
+    dict_bytes = _measure(as_dicts)
+    record_bytes = _measure(as_records)
+    total = tenants * n_questions
+
+    print(f"{tenants} tenants x {n_questions} questions = {total} questions")
+    print(f"dict     : {dict_bytes / 1e6:8.2f} MB  ({dict_bytes / total:6.0f} B/question)")
+    print(f"Question : {record_bytes / 1e6:8.2f} MB  ({record_bytes / total:6.0f} B/question)")
+    print(f"saving   : {100 * (1 - record_bytes / dict_bytes):7.1f} %")
+
+
+if __name__ == "__main__":
+    main()
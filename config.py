@@ -44,6 +44,22 @@ TTS_RATE: int = 165
 # Text-to-speech volume (0.0 to 1.0)
 TTS_VOLUME: float = 1.0
 
+# ---------------------------------------------------------------------------
+# SESSION RECORDING
+# ---------------------------------------------------------------------------
+
+# Write every captured answer into a per-session, memory-mapped WAV file
+RECORDING_ENABLED: bool = True
+
+# Folder (relative to the project) where session recordings are stored
+RECORDINGS_DIR: str = "recordings"
+
+# How much audio (in seconds) the mapped file grows by when it runs out of room
+RECORDING_GROWTH_SECONDS: float = 120.0
+
+# Bytes handed to the recognizer per AcceptWaveform call
+RECOGNIZER_CHUNK_BYTES: int = 8000
+
 # ---------------------------------------------------------------------------
 # SCORING CONSTANTS
 # ---------------------------------------------------------------------------
@@ -51,10 +67,73 @@ TTS_VOLUME: float = 1.0
 # Words considered as “hesitation” markers for confidence scoring
 HESITATION_WORDS = ["um", "uh", "hmm", "maybe", "i think"]
 
+# TF-IDF cosine similarity to the ideal answer needed for a "strong" / "partial"
+# verdict, even when the expected keywords were paraphrased.
+# Chosen on the TUNING answers in tests/test_similarity.py so that question
+# repeats and non-answers stay below PARTIAL and short partial answers below
+# STRONG; the HELD_OUT answers there check them on data not used for tuning.
+SIMILARITY_STRONG: float = 0.45
+SIMILARITY_PARTIAL: float = 0.10
+
 # Conceptual maximum scores (used for normalization / interpretation)
 MAX_KNOWLEDGE_SCORE: int = 10
 MAX_CONFIDENCE_SCORE: int = 10
 
+# ---------------------------------------------------------------------------
+# SESSION RESULTS
+# ---------------------------------------------------------------------------
+
+# Append every finished interview to RESULTS_DIR/sessions-YYYYMMDD.jsonl
+RESULTS_ENABLED: bool = True
+
+# Folder (relative to the project) where session results are stored
+RESULTS_DIR: str = "results"
+
+# ---------------------------------------------------------------------------
+# ADAPTIVE SCHEDULING
+# ---------------------------------------------------------------------------
+
+# Pick questions by difficulty based on running scores and stop early when stable
+ADAPTIVE_ENABLED: bool = True
+
+# Ordering of the "difficulty" labels used in the question banks
+DIFFICULTY_RANKS = {
+    "fresher": 0,
+    "all": 1,
+    "intermediate": 1,
+    "professional": 2,
+}
+
+# Per-question score (0.7 * knowledge + 0.3 * confidence) above which the
+# next question gets harder, and below which it gets easier
+ADAPTIVE_PROMOTE_SCORE: float = 10.0
+ADAPTIVE_DEMOTE_SCORE: float = 5.0
+
+# Never stop before this many questions have been asked
+ADAPTIVE_MIN_QUESTIONS: int = 3
+
+# Stop once the standard error of the per-question score drops below this
+ADAPTIVE_STOP_TOLERANCE: float = 1.5
+
+# ---------------------------------------------------------------------------
+# QUESTION BANK FILES (HOT RELOAD)
+# ---------------------------------------------------------------------------
+
+# Folder (relative to the project) with extra banks: <key>.json holding a list of
+# question objects in the same format as STRUCTURED_QUESTIONS below. A file named
+# like an existing key replaces that bank. Changes are picked up without a restart.
+BANKS_DIR: str = "banks"
+
+# How often (in seconds) the bank folder is checked for changes
+BANK_POLL_INTERVAL: float = 2.0
+
+# Save scraped questions for unknown careers into BANKS_DIR (in the background),
+# so later sessions for that career are served locally with keyword scoring
+ENRICHMENT_ENABLED: bool = True
+
+# Keywords derived per scraped question from the page text
+ENRICH_KEYWORDS_PER_QUESTION: int = 5
+
 # ---------------------------------------------------------------------------
 # STRUCTURED QUESTION BANK
 # ---------------------------------------------------------------------------
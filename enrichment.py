@@ -0,0 +1,197 @@
+"""
+enrichment.py
+
+BankEnricher:
+- Takes scraped (question, page section) pairs for careers without a bank
+- Derives candidate keywords per question with a cheap TF-IDF pass over the page
+- Persists them as BANKS_DIR/<career-slug>.json in the regular bank format
+- Runs on a background thread; the bank loader picks the file up on its next poll,
+  so later sessions for that career are served locally with keyword scoring
+"""
+
+import os
+import re
+import json
+import math
+import queue
+import tempfile
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from similarity import STOPWORDS
+from config import BANKS_DIR, ENRICH_KEYWORDS_PER_QUESTION
+
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]*(?:-[a-z0-9+#]+)*")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])[\"'\u201d]?\s+")
+# Start of the sample answer inside an advice-page section ("Example answer: ...")
+_EXAMPLE_RE = re.compile(r"\bexample(?:\s+answer)?\s*:\s*", re.IGNORECASE)
+# Sentences about the interview itself rather than the topic
+_META_RE = re.compile(
+    r"\b(?:interview(?:er|ers|ing)?|employers?|hiring|recruiters?|this question|your answer)\b",
+    re.IGNORECASE,
+)
+
+# Words that show up all over interview-advice pages but say nothing about the topic
+ADVICE_WORDS = frozenset(
+    "abilities ability able about also answer answering answers assess assessing because "
+    "been being best candidate candidates could demonstrate describe determine does each "
+    "employer employers every example examples explain give good great help hiring how "
+    "important including interview interviewer interviewers into just keep know learn "
+    "like make manager managers many mention might more most much need only other "
+    "position provide qualities question questions response role share should show skill "
+    "skills some specific such sure than they think those through time tips understand "
+    "understanding very want well what when where which while will work working would".split()
+)
+
+
+def _words(text: str) -> List[str]:
+    return [
+        w for w in _WORD_RE.findall(text.lower())
+        if len(w) >= 4 and w not in STOPWORDS and w not in ADVICE_WORDS
+    ]
+
+
+def _sentences(text: str) -> List[str]:
+    return [s for s in _SENTENCE_RE.split(text.strip()) if s]
+
+
+def _topic_text(text: str) -> str:
+    """The section without sentences that talk about the interview itself."""
+    return " ".join(s for s in _sentences(text) if not _META_RE.search(s))
+
+
+def derive_keywords(
+    sections: Sequence[Tuple[str, str]],
+    top_n: int = ENRICH_KEYWORDS_PER_QUESTION,
+) -> List[List[str]]:
+    """
+    For each (question, section_text), the top_n words by term frequency in
+    the section, down-weighted when they appear in every section of the page.
+    Words from the question itself and sentences about the interview
+    ("Interviewers ask this to assess ...") are skipped; ties go to the word
+    that appears first.
+    """
+    counts: List[Dict[str, int]] = []
+    doc_freq: Dict[str, int] = {}
+    for _, text in sections:
+        tf: Dict[str, int] = {}  # insertion order = first occurrence
+        for w in _words(_topic_text(text)):
+            tf[w] = tf.get(w, 0) + 1
+        counts.append(tf)
+        for w in tf:
+            doc_freq[w] = doc_freq.get(w, 0) + 1
+
+    n = len(sections)
+    keywords = []
+    for (question, _), tf in zip(sections, counts):
+        asked: Set[str] = set(_words(question))
+        ranked = sorted(
+            (w for w in tf if w not in asked),
+            key=lambda w: -tf[w] * (math.log((1 + n) / doc_freq[w]) + 1.0),
+        )
+        keywords.append(ranked[:top_n])
+    return keywords
+
+
+def _ideal_answer(text: str, max_sentences: int = 2, max_chars: int = 400) -> Optional[str]:
+    """
+    The opening sentences of the section's example answer, as a short
+    reference answer. None when the section has no example answer, so the
+    page's advice is never presented as what to say.
+    """
+    match = _EXAMPLE_RE.search(text)
+    if not match:
+        return None
+    sentences = [
+        s.strip("\"'\u201c\u201d ") for s in _sentences(text[match.end():])
+        if not _META_RE.search(s)
+    ]
+    sentences = [s for s in sentences if s]
+    if not sentences:
+        return None
+    return " ".join(sentences[:max_sentences])[:max_chars]
+
+
+def build_bank(sections: Sequence[Tuple[str, str]]) -> List[Dict[str, object]]:
+    """Scraped sections -> list of question dicts (STRUCTURED_QUESTIONS format)."""
+    return [
+        {
+            "question": question,
+            "keywords": keywords or None,
+            "ideal_answer": _ideal_answer(text),
+            "difficulty": "all",
+        }
+        for (question, text), keywords in zip(sections, derive_keywords(sections))
+    ]
+
+
+def write_bank(banks_dir: str, key: str, bank: List[Dict[str, object]]) -> str:
+    """Write atomically, so the loader never reads a half-written file."""
+    os.makedirs(banks_dir, exist_ok=True)
+    path = os.path.join(banks_dir, f"{key}.json")
+    fd, tmp_path = tempfile.mkstemp(dir=banks_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(bank, fh, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+class BankEnricher:
+    """
+    Flow:
+
+    1. submit(key, sections) -> queue a scraped career (duplicates are ignored)
+    2. worker thread         -> derive keywords, write BANKS_DIR/<key>.json
+    """
+
+    def __init__(self, banks_dir: str) -> None:
+        self.banks_dir = banks_dir
+        self._queue: "queue.Queue[Tuple[str, Sequence[Tuple[str, str]]]]" = queue.Queue()
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._work, name="bank-enricher", daemon=True)
+        self._thread.start()
+
+    def submit(self, key: str, sections: Sequence[Tuple[str, str]]) -> None:
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._queue.put((key, list(sections)))
+
+    def _work(self) -> None:
+        while True:
+            key, sections = self._queue.get()
+            try:
+                path = write_bank(self.banks_dir, key, build_bank(sections))
+                print(f"[Enrichment] Saved {len(sections)} scraped questions to {path}")
+            except Exception as exc:
+                # Never let one bad page kill the worker (submit/join would block)
+                print(f"[Enrichment Error] {exc}")
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
+
+    def join(self) -> None:
+        """Block until everything submitted so far has been written."""
+        self._queue.join()
+
+
+_enricher: Optional[BankEnricher] = None
+_enricher_lock = threading.Lock()
+
+
+def get_enricher() -> BankEnricher:
+    """Process-wide enricher, created on first use."""
+    global _enricher
+    with _enricher_lock:
+        if _enricher is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            _enricher = BankEnricher(os.path.join(base_dir, BANKS_DIR))
+        return _enricher
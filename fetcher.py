@@ -1,5 +1,5 @@
 """
-    Fetch interview questions from the web (Indeed) as a fallback when 
+    Fetch interview questions from the web (Indeed) as a fallback when
     there is no structured question bank for a give career/domain.
 """
 
@@ -8,32 +8,50 @@ from bs4  import BeautifulSoup
 from config import USER_AGENT, DEFAULT_QUESTIONS
 
 
-def fetch_questions(career:str):
+def fetch_question_sections(career: str):
     """
-    
-    Fetch interview quetions for the given career from Indeed.
-    Return up to 5 questions, or DEFAULT_QUESTIONS if anything fails.
-    
+
+    Fetch interview questions for the given career from Indeed, together with
+    the page text under each question heading (used to derive keywords).
+    Return up to 5 (question, section_text) pairs, or [] if anything fails.
+
     """
     career = career.strip().lower()
-    slug = career.replace("","-")
-    url = F"https://wwww.indeed.com/career-advice/interviewing/{slug}-interview-questions"
-    
+    slug = "-".join(career.split())
+    url = F"https://www.indeed.com/career-advice/interviewing/{slug}-interview-questions"
+
     try:
         response = requests.get(url,headers={"User-Agent":USER_AGENT},timeout=6)
         response.raise_for_status()
-        
+
         soup = BeautifulSoup(response.text,"html.parser")
-        
-        
-        questions = [
-            h2.get_text(strip= True)
-            for h2 in soup.find_all("h2")
-            if "?" in h2.get_text()
-        ]
-        return questions[:5] if questions else DEFAULT_QUESTIONS
+
+        sections = []
+        for h2 in soup.find_all("h2"):
+            question = h2.get_text(strip=True)
+            if "?" not in question:
+                continue
+
+            # Everything up to the next heading belongs to this question
+            parts = []
+            for sibling in h2.find_next_siblings():
+                if sibling.name in ("h1", "h2"):
+                    break
+                parts.append(sibling.get_text(" ", strip=True))
+            sections.append((question, " ".join(parts)))
+
+        return sections[:5]
     except Exception as exc:
         print(f"[Fetcher Error]{exc}")
-        return DEFAULT_QUESTIONS
-        
-    
\ No newline at end of file
+        return []
+
+
+def fetch_questions(career:str):
+    """
+
+    Fetch interview quetions for the given career from Indeed.
+    Return up to 5 questions, or DEFAULT_QUESTIONS if anything fails.
+
+    """
+    sections = fetch_question_sections(career)
+    return [q for q, _ in sections] if sections else DEFAULT_QUESTIONS
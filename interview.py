@@ -10,76 +10,142 @@ InterviewBot:
 - Gives feedback like a real interviewer
 """
 
+import os
 import time
-from typing import Dict, Any, List
+import itertools
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from voice import JarvisVoice
-from fetcher import fetch_questions
-from scorer import knowledge_score, confidence_score, analyze_answer
-from config import STRUCTURED_QUESTIONS
+from recorder import SessionRecorder
+from fetcher import fetch_question_sections
+from enrichment import get_enricher
+from scorer import (
+    knowledge_score,
+    confidence_score,
+    analyze_answer,
+    hesitation_count,
+    speaking_pace,
+)
+from results import save_session
+from questions import Question
+from bank_loader import get_loader, career_slug
+from scheduler import AdaptiveScheduler, build_difficulty_index
+from config import (
+    RECORDING_ENABLED,
+    RECORDINGS_DIR,
+    RESULTS_ENABLED,
+    DEFAULT_QUESTIONS,
+    ENRICHMENT_ENABLED,
+    ADAPTIVE_ENABLED,
+    DIFFICULTY_RANKS,
+)
+
+if TYPE_CHECKING:  # voice imports sounddevice, which needs PortAudio at import time
+    from voice import JarvisVoice
+
+# Distinguishes sessions started in the same second
+_SESSION_COUNTER = itertools.count(1)
+
+
+def resolve_bank_key(career: str, banks: Mapping[str, Sequence[Question]]) -> Optional[str]:
+    """Map a career string to a structured bank key in `banks` (None if no bank fits)."""
+    career = career.lower()
+    # Banks added as files are matched by name (e.g. banks/devops.json -> "devops")
+    slug = career_slug(career)
+    if slug in banks:
+        return slug
+
+    if "python" in career:
+        key = "python"
+    elif "aiml" in career or "ml" in career or "machine learning" in career:
+        key = "aiml"
+    elif "dsa" in career or "algorithm" in career:
+        key = "dsa"
+    elif "data science" in career or "data scientist" in career or "datascience" in career:
+        key = "datascience"
+    elif "web" in career or "frontend" in career or "fullstack" in career:
+        key = "webdev"
+    elif "cyber" in career or "security" in career:
+        key = "cybersecurity"
+    elif "hr" in career or "fresher" in career or "student" in career:
+        key = "general_hr"
+    else:
+        key = None
+
+    return key if key in banks else None
 
 
 class InterviewBot:
     """
     Flow:
 
-    1. _init_           -> set career, level, voice, questions
+    1. __init__         -> set career, level, voice, questions
     2. start()            -> orchestrates the full interview
     3. _greet_candidate() -> welcome + instructions
     4. _prepare_questions()-> choose structured or scraped questions
-    5. _run_interview_loop()-> loop over all questions
+    5. _run_interview_loop()-> adaptive (or fixed-order) question loop
     6. _ask_and_evaluate_question() -> per-question logic
     7. _summarize_results() -> final scoring & feedback
+    8. _save_results()      -> store the session for analytics.py
     """
 
-    def _init_(self, career: str, level: str) -> None:
+    def __init__(
+        self,
+        career: str,
+        level: str,
+        voice: Optional["JarvisVoice"] = None,
+        record: bool = RECORDING_ENABLED,
+        save_results: bool = RESULTS_ENABLED,
+    ) -> None:
         self.career = career.lower()
         self.level = level.lower()
-        self.voice = JarvisVoice()
-        self.questions: List[Dict[str, Any]] = self._prepare_questions()
+        # Any object with speak() / listen() works (e.g. loadtest.ScriptedVoice)
+        if voice is None:
+            from voice import JarvisVoice
+
+            voice = JarvisVoice()
+        self.voice = voice
+        self.record = record
+        self.save_results = save_results
+        self.session_id = time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}-{next(_SESSION_COUNTER)}"
+        self.started_at = time.time()
+        # Pinned for the whole session, so reloads never change a running interview
+        self.snapshot = get_loader().current()
+        self.bank_version: str = self.snapshot.version
+        self.bank_key: Optional[str] = self._resolve_bank_key()
+        self.questions: Sequence[Question] = self._prepare_questions()
+        self.similarity_index = (
+            self.snapshot.similarity_index[self.bank_key] if self.bank_key else None
+        )
         self.total_knowledge: float = 0.0
         self.total_confidence: float = 0.0
+        self.questions_asked: int = 0
+        # Seconds spent per stage of each question (ask, listen, score, analyze, feedback)
+        self.stage_timings: Dict[str, List[float]] = {}
+        # Per-question results, stored with the session
+        self.answers: List[Dict[str, Any]] = []
 
     # ------------------------------------------------------------------
     # PREPARE QUESTIONS
     # ------------------------------------------------------------------
-    def _prepare_questions(self) -> List[Dict[str, Any]]:
+    def _resolve_bank_key(self) -> Optional[str]:
+        """Map the career string to a structured bank key (None if no bank fits)."""
+        return resolve_bank_key(self.career, self.snapshot.banks)
+
+    def _prepare_questions(self) -> Sequence[Question]:
         """
         Prefer structured questions. If none for this career, fall back to web-scraped ones.
         """
+        if self.bank_key:
+            return self.snapshot.banks[self.bank_key]
 
-        # Map career string to a structured key
-        if "python" in self.career:
-            key = "python"
-        elif "aiml" in self.career or "ml" in self.career or "machine learning" in self.career:
-            key = "aiml"
-        elif "dsa" in self.career or "algorithm" in self.career:
-            key = "dsa"
-        elif "data science" in self.career or "data scientist" in self.career or "datascience" in self.career:
-            key = "datascience"
-        elif "web" in self.career or "frontend" in self.career or "fullstack" in self.career:
-            key = "webdev"
-        elif "cyber" in self.career or "security" in self.career:
-            key = "cybersecurity"
-        elif "hr" in self.career or "fresher" in self.career or "student" in self.career:
-            key = "general_hr"
-        else:
-            key = None
-
-        if key and key in STRUCTURED_QUESTIONS:
-            return STRUCTURED_QUESTIONS[key]
-
-        # Fallback: scrape
-        fetched = fetch_questions(self.career)
-        return [
-            {
-                "question": q,
-                "keywords": None,
-                "difficulty": "all",
-                "ideal_answer": None,
-            }
-            for q in fetched
-        ]
+        # Fallback: scrape, and let the enricher turn the page into a local bank
+        sections = fetch_question_sections(self.career)
+        if not sections:
+            return tuple(Question.create(q) for q in DEFAULT_QUESTIONS)
+
+        if ENRICHMENT_ENABLED and career_slug(self.career):
+            get_enricher().submit(career_slug(self.career), sections)
+        return tuple(Question.create(q) for q, _ in sections)
 
     # ------------------------------------------------------------------
     # GREETING
@@ -96,7 +162,9 @@ class InterviewBot:
     # ------------------------------------------------------------------
     # SINGLE QUESTION FLOW
     # ------------------------------------------------------------------
-    def _ask_and_evaluate_question(self, question_dict: Dict[str, Any], index: int) -> None:
+    def _ask_and_evaluate_question(
+        self, question: Question, index: int, position: Optional[int] = None
+    ) -> Tuple[float, float]:
         """
         Single question lifecycle:
         - Ask
@@ -104,22 +172,27 @@ class InterviewBot:
         - Score
         - Analyze correctness
         - Give feedback
+
+        `position` is the question's row in the bank (for ideal-answer similarity).
+        Returns (knowledge, confidence) for this question.
         """
 
-        question_text = question_dict.get("question", "")
-        expected_keywords = question_dict.get("keywords")
-        ideal_answer = question_dict.get("ideal_answer")
+        question_text = question.question
+        ideal_answer = question.ideal_answer
 
         # Ask
+        mark = time.perf_counter()
         self.voice.speak(f"Question {index}: {question_text}")
         print(f"\n[Question {index}] {question_text}")
+        mark = self._time_stage("ask", mark)
 
         # Listen
         start_time = time.time()
-        answer = self.voice.listen()
+        answer = self.voice.listen(question_index=index)
         duration = time.time() - start_time
 
         print(f"[Your answer] {answer}")
+        mark = self._time_stage("listen", mark)
 
         # Score
         ks = knowledge_score(answer)
@@ -127,13 +200,36 @@ class InterviewBot:
 
         self.total_knowledge += ks
         self.total_confidence += cs
+        self.questions_asked += 1
+        mark = self._time_stage("score", mark)
 
         # Analyze correctness
+        similarity = None
+        if self.similarity_index is not None and position is not None and answer.strip():
+            similarity = self.similarity_index.score(answer, position)
+
         verdict, missing, feedback = analyze_answer(
             answer,
-            expected_keywords=expected_keywords,
+            expected_keywords=question.keywords,
             ideal_answer=ideal_answer,
+            similarity=similarity,
+            keywords_lower=question.keywords_lower,
         )
+        mark = self._time_stage("analyze", mark)
+
+        self.answers.append({
+            "question": question_text,
+            "position": position,
+            "difficulty": question.difficulty,
+            "verdict": verdict,
+            "knowledge": round(ks, 3),
+            "confidence": round(cs, 3),
+            "similarity": None if similarity is None else round(similarity, 4),
+            "missing": missing,
+            "hesitations": hesitation_count(answer),
+            "pace": round(speaking_pace(answer, duration), 3),
+            "duration": round(duration, 3),
+        })
 
         # Interviewer-style reaction
         if verdict == "strong":
@@ -150,20 +246,61 @@ class InterviewBot:
         # Detailed feedback in console
         print(f"[Feedback] {feedback}")
         print(f"[Scores] Knowledge: {ks:.1f} / 10, Confidence: {cs:.1f} / 10")
+        self._time_stage("feedback", mark)
+
+        return ks, cs
+
+    def _time_stage(self, stage: str, started: float) -> float:
+        """Record the time since `started` for `stage`; returns the new mark."""
+        now = time.perf_counter()
+        self.stage_timings.setdefault(stage, []).append(now - started)
+        return now
 
     # ------------------------------------------------------------------
     # QUESTION LOOP
     # ------------------------------------------------------------------
     def _run_interview_loop(self) -> None:
-        """Iterate through all questions."""
-        for idx, q in enumerate(self.questions, start=1):
-            self._ask_and_evaluate_question(q, idx)
+        """Iterate through the questions, adaptively when enabled."""
+        if not ADAPTIVE_ENABLED:
+            for idx, q in enumerate(self.questions, start=1):
+                self._ask_and_evaluate_question(q, idx, idx - 1)
+            return
+
+        index = self.snapshot.difficulty_index.get(self.bank_key) if self.bank_key else None
+        scheduler = AdaptiveScheduler(
+            self.questions,
+            index if index is not None else build_difficulty_index(self.questions),
+            start_rank=DIFFICULTY_RANKS.get(self.level.strip(), 0),
+        )
+
+        while True:
+            picked = scheduler.next_question()
+            if picked is None:
+                break
+
+            pos, q = picked
+            ks, cs = self._ask_and_evaluate_question(q, scheduler.asked + 1, pos)
+            scheduler.record((ks * 0.7) + (cs * 0.3))
+
+            if scheduler.should_stop():
+                break
 
     # ------------------------------------------------------------------
     # SUMMARY
     # ------------------------------------------------------------------
     def _summarize_results(self):
         """Compute final score and give a summary like a real interviewer."""
+        # Early stopping asks fewer questions; project totals onto the full bank
+        # so the final score stays on the same scale.
+        if 0 < self.questions_asked < len(self.questions):
+            scale = len(self.questions) / self.questions_asked
+            print(
+                f"[Adaptive] Stopped after {self.questions_asked} of {len(self.questions)} "
+                "questions; totals are projected to the full bank."
+            )
+            self.total_knowledge *= scale
+            self.total_confidence *= scale
+
         final_score = (self.total_knowledge * 0.7) + (self.total_confidence * 0.3)
 
         self.voice.speak("We have finished the interview.")
@@ -173,6 +310,7 @@ class InterviewBot:
         print(f"Total Knowledge Score:  {self.total_knowledge:.2f}")
         print(f"Total Confidence Score: {self.total_confidence:.2f}")
         print(f"Final Score:            {final_score:.2f} / 100")
+        print(f"Question Bank Version:  {self.bank_version}")
         print("=============================")
 
         # Extra verbal verdict
@@ -193,6 +331,59 @@ class InterviewBot:
 
         return self.total_knowledge, self.total_confidence, final_score
 
+    def _save_results(self, final_score: float) -> None:
+        """Append this session to the results store (see results.py)."""
+        if not self.save_results:
+            return
+
+        record = {
+            "session_id": self.session_id,
+            "started_at": round(self.started_at, 3),
+            "career": self.career,
+            "bank_key": self.bank_key or career_slug(self.career),
+            "level": self.level.strip(),
+            "bank_version": self.bank_version,
+            "questions_total": len(self.questions),
+            "knowledge": round(self.total_knowledge, 3),
+            "confidence": round(self.total_confidence, 3),
+            "final_score": round(final_score, 3),
+            "answers": self.answers,
+        }
+        try:
+            save_session(record)
+        except OSError as exc:
+            print(f"[Results Error] {exc}")
+
+    # ------------------------------------------------------------------
+    # RECORDING
+    # ------------------------------------------------------------------
+    def _open_recorder(self) -> None:
+        """Attach a memory-mapped session recording to the voice, if enabled."""
+        if not self.record:
+            return
+
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        slug = career_slug(self.career) or "session"
+        path = os.path.join(base_dir, RECORDINGS_DIR, f"{slug}-{self.session_id}.wav")
+
+        try:
+            self.voice.recorder = SessionRecorder(path, self.voice.sample_rate)
+        except OSError as exc:
+            print(f"[Recording Error] {exc}")
+
+    def _close_recorder(self) -> None:
+        recorder = self.voice.recorder
+        if recorder is None:
+            return
+
+        self.voice.recorder = None
+        try:
+            recorder.close()
+            print(f"[Recording] Saved to {recorder.path}")
+        except (OSError, BufferError) as exc:
+            # A recording problem must never lose the session result
+            print(f"[Recording Error] {exc}")
+
     # ------------------------------------------------------------------
     # PUBLIC ENTRY
     # ------------------------------------------------------------------
@@ -202,7 +393,15 @@ class InterviewBot:
         1. greet
         2. question loop
         3. summary
+        4. save results
         """
-        self._greet_candidate()
-        self._run_interview_loop()
-        return self._summarize_results()
\ No newline at end of file
+        self._open_recorder()
+        try:
+            self._greet_candidate()
+            self._run_interview_loop()
+        finally:
+            self._close_recorder()
+
+        knowledge, confidence, final_score = self._summarize_results()
+        self._save_results(final_score)
+        return knowledge, confidence, final_score
\ No newline at end of file
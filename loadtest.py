@@ -0,0 +1,433 @@
+"""
+loadtest.py
+
+Offline load generator for InterviewBot:
+- Runs N simulated candidates concurrently (one thread each)
+- Candidates replay scripted transcripts, or synthetic WAVs through Vosk
+- Speech and listening are simulated at real time or accelerated (--speedup)
+- Reports per-stage latency percentiles, throughput, CPU and RSS over time
+- Exits with status 1 if any configured SLO is violated
+
+Examples:
+
+    python loadtest.py --candidates 50 --sessions 4 --speedup 20
+    python loadtest.py --candidates 20 --duration 60 --slo analyze:p99=20 --slo session:p95=5000
+    python loadtest.py --candidates 8 --wav-dir synthetic_wavs --speedup 4
+"""
+
+import os
+import io
+import sys
+import json
+import glob
+import time
+import wave
+import random
+import argparse
+import threading
+import contextlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bank_loader import get_loader
+from config import TTS_RATE
+from stt import MODEL_DIR_NAME, transcribe
+from interview import InterviewBot, resolve_bank_key
+
+
+STAGES = ("ask", "listen", "score", "analyze", "feedback", "session")
+PERCENTILES = (50, 90, 95, 99)
+
+
+# ---------------------------------------------------------------------------
+# SIMULATED CANDIDATES
+# ---------------------------------------------------------------------------
+
+class ScriptedVoice:
+    """
+    Stand-in for JarvisVoice: speaking and listening take (simulated) time,
+    and answers come from a script instead of a microphone.
+    """
+
+    sample_rate = 16000
+
+    def __init__(self, answers: Sequence[str], speedup: float, answer_seconds: float) -> None:
+        self.answers = list(answers)
+        self.speedup = speedup
+        self.answer_seconds = answer_seconds
+        self.recorder = None
+        self._next = 0
+
+    def speak(self, text: str) -> None:
+        # Time a TTS engine at TTS_RATE words per minute would need
+        time.sleep(len(text.split()) * 60.0 / TTS_RATE / self.speedup)
+
+    def _next_answer(self) -> str:
+        answer = self.answers[self._next % len(self.answers)] if self.answers else ""
+        self._next += 1
+        return answer
+
+    def listen(self, duration: float = 8.0, question_index: Optional[int] = None) -> str:
+        time.sleep(self.answer_seconds / self.speedup)
+        return self._next_answer()
+
+
+class WavVoice(ScriptedVoice):
+    """
+    ScriptedVoice whose answers are 16 kHz mono int16 WAV files decoded by Vosk,
+    so the recognizer's CPU cost is part of the load.
+    """
+
+    _model = None
+    _model_lock = threading.Lock()
+
+    def __init__(self, wav_paths: Sequence[str], speedup: float) -> None:
+        super().__init__([], speedup, 0.0)
+        self.wav_paths = list(wav_paths)
+
+    @classmethod
+    def _shared_model(cls):
+        from vosk import Model
+
+        with cls._model_lock:
+            if cls._model is None:
+                base_dir = os.path.dirname(os.path.abspath(__file__))
+                cls._model = Model(os.path.join(base_dir, MODEL_DIR_NAME))
+            return cls._model
+
+    def listen(self, duration: float = 8.0, question_index: Optional[int] = None) -> str:
+        from vosk import KaldiRecognizer
+
+        path = self.wav_paths[self._next % len(self.wav_paths)]
+        self._next += 1
+
+        with wave.open(path, "rb") as wav:
+            frames = wav.readframes(wav.getnframes())
+            seconds = wav.getnframes() / wav.getframerate()
+        time.sleep(seconds / self.speedup)
+
+        recognizer = KaldiRecognizer(self._shared_model(), self.sample_rate)
+        data = memoryview(frames)
+        try:
+            return transcribe(recognizer, data)
+        finally:
+            data.release()
+
+
+def synthetic_transcripts(career_key: str, rng: random.Random, count: int = 8) -> List[str]:
+    """Mix of strong, partial, hesitant and empty answers built from the bank itself."""
+    bank = get_loader().current().banks.get(career_key, ())
+    answers = []
+    for _ in range(count):
+        q = rng.choice(bank) if bank else None
+        roll = rng.random()
+        if q is None or roll < 0.1:
+            answers.append("")
+        elif roll < 0.5 and q.ideal_answer:
+            answers.append(q.ideal_answer)
+        elif roll < 0.8 and q.keywords:
+            picked = rng.sample(list(q.keywords), k=max(1, len(q.keywords) // 2))
+            answers.append("um I think it is about " + " and ".join(picked))
+        else:
+            answers.append("hmm maybe I don't know, I have not used that much")
+    return answers
+
+
+# ---------------------------------------------------------------------------
+# RESOURCE SAMPLING (Linux /proc, no extra dependencies)
+# ---------------------------------------------------------------------------
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm", "r") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class ResourceSampler(threading.Thread):
+    """Samples (elapsed s, CPU %, RSS MB) every `interval` seconds."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="resource-sampler", daemon=True)
+        self.interval = interval
+        self.samples: List[Tuple[float, float, float]] = []
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        start = last_wall = time.monotonic()
+        last_cpu = time.process_time()
+        while not self._stop_event.wait(self.interval):
+            wall, cpu = time.monotonic(), time.process_time()
+            cpu_pct = 100.0 * (cpu - last_cpu) / max(wall - last_wall, 1e-9)
+            self.samples.append((wall - start, cpu_pct, _rss_bytes() / 1e6))
+            last_wall, last_cpu = wall, cpu
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+# ---------------------------------------------------------------------------
+# RUN
+# ---------------------------------------------------------------------------
+
+class LoadTest:
+    """
+    Flow:
+
+    1. run()     -> start sampler + N candidate threads, wait for them
+    2. report()  -> latency percentiles, throughput, resource timeline
+    3. check()   -> list of SLO violations
+    """
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.careers = [c.strip() for c in args.careers.split(",") if c.strip()]
+        self.wav_paths = sorted(glob.glob(os.path.join(args.wav_dir, "*.wav"))) if args.wav_dir else []
+        self.scripts = self._load_scripts(args.transcripts)
+
+        self.timings: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        self.sessions = 0
+        self.questions = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        self.sampler = ResourceSampler(args.sample_interval)
+
+    @staticmethod
+    def _load_scripts(path: Optional[str]) -> List[List[str]]:
+        """JSON file: a list of answer lists, one per simulated candidate (reused round-robin)."""
+        if not path:
+            return []
+        with open(path, "r", encoding="utf-8") as fh:
+            scripts = json.load(fh)
+        return [list(map(str, s)) for s in scripts]
+
+    def _make_voice(self, candidate: int, career: str, rng: random.Random) -> ScriptedVoice:
+        if self.wav_paths:
+            return WavVoice(self.wav_paths, self.args.speedup)
+        if self.scripts:
+            answers = self.scripts[candidate % len(self.scripts)]
+        else:
+            answers = synthetic_transcripts(resolve_bank_key(career, get_loader().current().banks), rng)
+        return ScriptedVoice(answers, self.args.speedup, self.args.answer_seconds)
+
+    def _candidate(self, candidate: int, deadline: Optional[float]) -> None:
+        rng = random.Random(self.args.seed + candidate)
+        done = 0
+        while True:
+            if deadline is not None:
+                if time.monotonic() >= deadline:
+                    break
+            elif done >= self.args.sessions:
+                break
+
+            career = self.careers[(candidate + done) % len(self.careers)]
+            started = time.perf_counter()
+            try:
+                bot = InterviewBot(
+                    career,
+                    self.args.level,
+                    voice=self._make_voice(candidate, career, rng),
+                    record=False,
+                    save_results=self.args.save_results,
+                )
+                bot.start()
+            except Exception as exc:
+                with self._lock:
+                    self.errors += 1
+                sys.__stderr__.write(f"[Load Test Error] candidate {candidate}: {exc}\n")
+                done += 1
+                continue
+
+            with self._lock:
+                self.timings["session"].append(time.perf_counter() - started)
+                for stage, values in bot.stage_timings.items():
+                    self.timings.setdefault(stage, []).extend(values)
+                self.sessions += 1
+                self.questions += bot.questions_asked
+            done += 1
+
+    def run(self) -> None:
+        get_loader()  # build the first bank snapshot before the clock starts
+        deadline = time.monotonic() + self.args.duration if self.args.duration else None
+
+        threads = [
+            threading.Thread(target=self._candidate, args=(i, deadline), name=f"candidate-{i}")
+            for i in range(self.args.candidates)
+        ]
+
+        self.sampler.start()
+        started = time.monotonic()
+        # The bot narrates everything; keep the console for the report
+        with contextlib.redirect_stdout(io.StringIO() if self.args.quiet else sys.stdout):
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.elapsed = time.monotonic() - started
+        self.sampler.stop()
+
+    # ------------------------------------------------------------------
+    # REPORTING
+    # ------------------------------------------------------------------
+    def percentiles_ms(self) -> Dict[str, Dict[str, float]]:
+        table = {}
+        for stage, values in self.timings.items():
+            if not values:
+                continue
+            arr = np.asarray(values) * 1000.0
+            row = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(arr, PERCENTILES))}
+            row["max"] = float(arr.max())
+            row["count"] = float(arr.size)
+            table[stage] = row
+        return table
+
+    def report(self) -> None:
+        table = self.percentiles_ms()
+        print("\n===== LOAD TEST =====")
+        print(
+            f"Candidates: {self.args.candidates}  Speedup: {self.args.speedup}x  "
+            f"Elapsed: {self.elapsed:.1f}s  Errors: {self.errors}"
+        )
+        print(
+            f"Throughput: {self.sessions / self.elapsed:.2f} sessions/s, "
+            f"{self.questions / self.elapsed:.2f} questions/s "
+            f"({self.sessions} sessions, {self.questions} questions)"
+        )
+
+        print(f"\n{'stage':<10}" + "".join(f"{h:>10}" for h in [f"p{p}" for p in PERCENTILES] + ["max", "count"]))
+        for stage in STAGES:
+            row = table.get(stage)
+            if row is None:
+                continue
+            cells = [f"{row[f'p{p}']:10.2f}" for p in PERCENTILES] + [f"{row['max']:10.2f}", f"{int(row['count']):10d}"]
+            print(f"{stage:<10}" + "".join(cells))
+        print("(latencies in ms)")
+
+        if self.sampler.samples:
+            samples = np.asarray(self.sampler.samples)
+            print(
+                f"\nCPU %:  mean {samples[:, 1].mean():.1f}  max {samples[:, 1].max():.1f}"
+                f"\nRSS MB: start {samples[0, 2]:.1f}  max {samples[:, 2].max():.1f}  end {samples[-1, 2]:.1f}"
+            )
+            print("\n t(s)    CPU %   RSS MB")
+            step = max(1, len(samples) // 20)
+            for t, cpu, rss in samples[::step]:
+                print(f"{t:5.1f}  {cpu:7.1f}  {rss:7.1f}")
+
+            if self.args.timeline_csv:
+                np.savetxt(
+                    self.args.timeline_csv,
+                    samples,
+                    delimiter=",",
+                    header="elapsed_s,cpu_pct,rss_mb",
+                    comments="",
+                    fmt="%.3f",
+                )
+        print("=====================")
+
+    def check(self) -> List[str]:
+        """Compare results with --slo, --min-throughput, --max-rss-mb and errors."""
+        violations = []
+        table = self.percentiles_ms()
+
+        for spec in self.args.slo:
+            stage, limit = parse_slo(spec)
+            key = limit[0]
+            row = table.get(stage)
+            if row is None:
+                violations.append(f"{spec}: no samples for stage '{stage}'")
+            elif row[key] > limit[1]:
+                violations.append(f"{spec}: measured {row[key]:.2f} ms")
+
+        if self.args.min_throughput and self.sessions / self.elapsed < self.args.min_throughput:
+            violations.append(
+                f"throughput {self.sessions / self.elapsed:.2f} sessions/s "
+                f"< {self.args.min_throughput}"
+            )
+
+        if self.args.max_rss_mb and self.sampler.samples:
+            peak = max(s[2] for s in self.sampler.samples)
+            if peak > self.args.max_rss_mb:
+                violations.append(f"peak RSS {peak:.1f} MB > {self.args.max_rss_mb} MB")
+
+        if self.errors:
+            violations.append(f"{self.errors} session(s) failed")
+
+        return violations
+
+
+def parse_slo(spec: str) -> Tuple[str, Tuple[str, float]]:
+    """'analyze:p99=20' -> ('analyze', ('p99', 20.0)); limits are in ms."""
+    try:
+        stage, rest = spec.split(":", 1)
+        key, value = rest.split("=", 1)
+        key = key.strip().lower()
+        if key != "max" and key not in {f"p{p}" for p in PERCENTILES}:
+            raise ValueError
+        return stage.strip().lower(), (key, float(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid SLO '{spec}' (expected STAGE:pNN=MS or STAGE:max=MS)"
+        ) from None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate concurrent candidates against InterviewBot.")
+    parser.add_argument("--candidates", type=int, default=10, help="concurrent simulated candidates")
+    parser.add_argument("--sessions", type=int, default=3, help="sessions per candidate (ignored with --duration)")
+    parser.add_argument("--duration", type=float, default=0.0, help="run for this many seconds instead")
+    parser.add_argument(
+        "--careers",
+        default="python,aiml,dsa,datascience,webdev,cybersecurity,general_hr",
+        help="comma-separated careers / bank keys, assigned round-robin (each must resolve to a bank)",
+    )
+    parser.add_argument("--level", default="fresher")
+    parser.add_argument("--speedup", type=float, default=10.0, help="1 = real time")
+    parser.add_argument("--answer-seconds", type=float, default=8.0, help="simulated answer length")
+    parser.add_argument("--transcripts", help="JSON list of answer lists to replay")
+    parser.add_argument("--wav-dir", help="folder of 16 kHz mono WAV answers to decode with Vosk")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sample-interval", type=float, default=0.5, help="CPU / RSS sampling period (s)")
+    parser.add_argument("--timeline-csv", help="write the CPU / RSS timeline to this CSV file")
+    parser.add_argument("--slo", action="append", default=[], help="e.g. analyze:p99=20 (ms); repeatable")
+    parser.add_argument("--min-throughput", type=float, default=0.0, help="sessions/s")
+    parser.add_argument("--max-rss-mb", type=float, default=0.0)
+    parser.add_argument("--save-results", action="store_true", help="store sessions for analytics.py")
+    parser.add_argument("--verbose", dest="quiet", action="store_false", help="show the bots' console output")
+    args = parser.parse_args(argv)
+
+    for spec in args.slo:
+        try:
+            parse_slo(spec)
+        except argparse.ArgumentTypeError as exc:
+            parser.error(str(exc))
+    if args.speedup <= 0:
+        parser.error("--speedup must be positive")
+    if args.wav_dir and not glob.glob(os.path.join(args.wav_dir, "*.wav")):
+        parser.error(f"no .wav files in {args.wav_dir}")
+    # Careers without a local bank would scrape the web and write enriched banks
+    banks = get_loader().current().banks
+    unknown = [c for c in args.careers.split(",") if c.strip() and not resolve_bank_key(c.strip(), banks)]
+    if unknown:
+        parser.error(
+            f"no question bank for career(s): {', '.join(unknown)} (known: {', '.join(sorted(banks))})"
+        )
+
+    test = LoadTest(args)
+    test.run()
+    test.report()
+
+    violations = test.check()
+    if violations:
+        print("\nSLO VIOLATIONS:")
+        for v in violations:
+            print(f"  - {v}")
+        return 1
+
+    print("\nAll SLOs met.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
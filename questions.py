@@ -0,0 +1,90 @@
+"""
+questions.py
+
+Question:
+- Immutable, slotted record for one interview question
+- Keywords and difficulty labels are interned (shared across banks / sessions)
+- Lowercased keyword forms and the difficulty rank are computed once at load time
+
+Banks are loaded into tuples of Question by bank_loader and shared by all sessions.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from config import DIFFICULTY_RANKS
+
+
+def difficulty_rank(label: Optional[str]) -> int:
+    """Map a difficulty label to its rank (unknown labels count as 'all')."""
+    return DIFFICULTY_RANKS.get((label or "all").strip().lower(), DIFFICULTY_RANKS["all"])
+
+
+def _intern_all(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(v) for v in values)
+
+
+@dataclass(frozen=True)
+class Question:
+    __slots__ = (
+        "question",
+        "keywords",
+        "ideal_answer",
+        "difficulty",
+        "keywords_lower",
+        "difficulty_rank",
+    )
+
+    question: str
+    keywords: Optional[Tuple[str, ...]]
+    ideal_answer: Optional[str]
+    difficulty: str
+    keywords_lower: Tuple[str, ...]
+    difficulty_rank: int
+
+    @classmethod
+    def create(
+        cls,
+        question: str,
+        keywords: Optional[Iterable[str]] = None,
+        ideal_answer: Optional[str] = None,
+        difficulty: Optional[str] = None,
+    ) -> "Question":
+        """Build a Question, interning keywords and precomputing derived fields."""
+        kw = _intern_all(keywords) if keywords else None
+        lowered = _intern_all(k.lower() for k in kw) if kw else ()
+        label = sys.intern((difficulty or "all").strip().lower())
+        return cls(
+            question=question,
+            keywords=kw,
+            ideal_answer=ideal_answer,
+            difficulty=label,
+            # Share the tuple when the keywords are already lowercase
+            keywords_lower=kw if lowered == kw else lowered,
+            difficulty_rank=difficulty_rank(label),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Question":
+        """Build from the dict format used in config.STRUCTURED_QUESTIONS."""
+        return cls.create(
+            data.get("question", ""),
+            keywords=data.get("keywords"),
+            ideal_answer=data.get("ideal_answer"),
+            difficulty=data.get("difficulty"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "question": self.question,
+            "keywords": list(self.keywords) if self.keywords else None,
+            "ideal_answer": self.ideal_answer,
+            "difficulty": self.difficulty,
+        }
+
+
+def load_bank(items: Iterable[Dict[str, Any]]) -> Tuple[Question, ...]:
+    """Convert a list of question dicts into an immutable bank."""
+    return tuple(Question.from_dict(item) for item in items)
+
@@ -0,0 +1,172 @@
+"""
+recorder.py
+
+SessionRecorder:
+- Writes captured microphone audio into a memory-mapped, per-session WAV file
+- Audio blocks are appended straight into the mapping (from an InputStream
+  callback); no buffer is ever handed to sounddevice to keep
+- Exposes answer segments as memoryview slices (no intermediate copies)
+- Keeps a compact index of answer offsets per question (JSON sidecar)
+"""
+
+import os
+import json
+import mmap
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import RECORDING_GROWTH_SECONDS
+
+
+WAV_HEADER_SIZE = 44
+SAMPLE_WIDTH = 2  # int16
+CHANNELS = 1
+
+
+def _wav_header(sample_rate: int, data_bytes: int) -> bytes:
+    """Canonical 44-byte PCM WAV header (mono, 16-bit)."""
+    byte_rate = sample_rate * CHANNELS * SAMPLE_WIDTH
+    block_align = CHANNELS * SAMPLE_WIDTH
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        CHANNELS,
+        sample_rate,
+        byte_rate,
+        block_align,
+        SAMPLE_WIDTH * 8,
+        b"data",
+        data_bytes,
+    )
+
+
+class SessionRecorder:
+    """
+    Flow:
+
+    1. append(block)           -> copy an int16 block into the mapped file
+    2. commit(question)        -> index everything appended since the last commit
+    3. segment(question)       -> memoryview over that answer's PCM bytes
+    4. close()                 -> finalize WAV header, trim file, write index
+
+    Views returned by commit()/segment() should be released by the caller,
+    but a view that is still alive never breaks growing or closing.
+    """
+
+    def __init__(self, path: str, sample_rate: int = 16000) -> None:
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + ".index.json"
+        self.sample_rate = sample_rate
+        self.frames_written = 0  # committed frames
+        self._pending = 0          # appended but not yet committed
+        self.index: List[Dict[str, int]] = []
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "w+b")
+        self._capacity = 0
+        self._mmap: Optional[mmap.mmap] = None
+        self._grow(int(RECORDING_GROWTH_SECONDS * sample_rate))
+
+    # ------------------------------------------------------------------
+    # MAPPING
+    # ------------------------------------------------------------------
+    def _grow(self, min_frames: int) -> None:
+        """Extend the backing file so at least `min_frames` more fit after the head."""
+        needed = self.frames_written + self._pending + min_frames
+        if needed <= self._capacity:
+            return
+
+        step = int(RECORDING_GROWTH_SECONDS * self.sample_rate)
+        capacity = max(needed, self._capacity + step)
+
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._release_mapping()
+
+        self._file.truncate(WAV_HEADER_SIZE + capacity * SAMPLE_WIDTH)
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._mmap[:WAV_HEADER_SIZE] = _wav_header(self.sample_rate, 0)
+        self._capacity = capacity
+
+    def _release_mapping(self) -> None:
+        """
+        Drop the current mapping. If views into it are still alive, closing
+        raises BufferError; the mapping is then left for the garbage collector
+        (it unmaps once the last view is gone) and the file stays usable.
+        """
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._mmap = None
+
+    def append(self, block: np.ndarray) -> int:
+        """Copy an int16 block (frames, 1) into the file after the write head; returns frames."""
+        data = np.ascontiguousarray(block, dtype=np.int16)
+        frames = len(data)
+        self._grow(frames)
+        start = WAV_HEADER_SIZE + (self.frames_written + self._pending) * SAMPLE_WIDTH
+        self._mmap[start:start + data.nbytes] = memoryview(data).cast("B")
+        self._pending += frames
+        return frames
+
+    def discard(self) -> None:
+        """Forget frames appended since the last commit (e.g. after a failed recording)."""
+        self._pending = 0
+
+    def commit(self, question_index: int) -> memoryview:
+        """
+        Record that the frames appended since the last commit belong to
+        `question_index`. Returns a memoryview over those bytes for the recognizer.
+        """
+        offset, frames = self.frames_written, self._pending
+        self.frames_written += frames
+        self._pending = 0
+        self.index.append({"question": question_index, "offset": offset, "frames": frames})
+        return self._view(offset, frames)
+
+    def _view(self, offset: int, frames: int) -> memoryview:
+        start = WAV_HEADER_SIZE + offset * SAMPLE_WIDTH
+        return memoryview(self._mmap)[start:start + frames * SAMPLE_WIDTH]
+
+    def segment(self, question_index: int) -> Optional[memoryview]:
+        """Memoryview over the most recent answer recorded for `question_index`."""
+        for entry in reversed(self.index):
+            if entry["question"] == question_index:
+                return self._view(entry["offset"], entry["frames"])
+        return None
+
+    # ------------------------------------------------------------------
+    # FINALIZE
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Write the final WAV header, trim unused capacity and save the index."""
+        if self._mmap is None:
+            return
+
+        data_bytes = self.frames_written * SAMPLE_WIDTH
+        self._mmap[:WAV_HEADER_SIZE] = _wav_header(self.sample_rate, data_bytes)
+        self._mmap.flush()
+        self._release_mapping()
+
+        try:
+            self._file.truncate(WAV_HEADER_SIZE + data_bytes)
+        except OSError as exc:
+            # Windows refuses while a view still maps the file; the header
+            # already carries the real data size, so the WAV stays valid.
+            print(f"[Recording] Could not trim {self.path}: {exc}")
+        self._file.close()
+
+        with open(self.index_path, "w", encoding="utf-8") as fh:
+            json.dump(
+                {"sample_rate": self.sample_rate, "answers": self.index},
+                fh,
+                separators=(",", ":"),
+            )
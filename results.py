@@ -0,0 +1,36 @@
+"""
+results.py
+
+Session result storage:
+- One JSON object per finished interview, appended to RESULTS_DIR/sessions-YYYYMMDD.jsonl
+- Read back in bulk by analytics.py
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Any, Dict
+
+from config import RESULTS_DIR
+
+
+_write_lock = threading.Lock()
+
+
+def results_dir() -> str:
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, RESULTS_DIR)
+
+
+def save_session(record: Dict[str, Any], directory: str = "") -> str:
+    """Append one session record as a single JSON line; returns the file path."""
+    directory = directory or results_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, time.strftime("sessions-%Y%m%d.jsonl"))
+
+    line = json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+    with _write_lock:
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+    return path
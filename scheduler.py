@@ -0,0 +1,115 @@
+"""
+scheduler.py
+
+AdaptiveScheduler:
+- Uses a precomputed per-career difficulty index (rank -> question positions,
+  built per bank snapshot by bank_loader)
+- Picks the next question closest to a target difficulty
+- Moves the target up or down based on the running scores
+- Stops early once the score estimate is stable within a tolerance
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from questions import Question
+from config import (
+    DIFFICULTY_RANKS,
+    ADAPTIVE_PROMOTE_SCORE,
+    ADAPTIVE_DEMOTE_SCORE,
+    ADAPTIVE_MIN_QUESTIONS,
+    ADAPTIVE_STOP_TOLERANCE,
+)
+
+
+def build_difficulty_index(questions: Sequence[Question]) -> Dict[int, List[int]]:
+    """
+    Group question positions by difficulty rank, keeping bank order
+    inside each rank.
+    """
+    index: Dict[int, List[int]] = {}
+    for pos, q in enumerate(questions):
+        index.setdefault(q.difficulty_rank, []).append(pos)
+    return index
+
+
+class AdaptiveScheduler:
+    """
+    Flow:
+
+    1. next_question() -> (position, question) nearest the target difficulty
+    2. record(score)   -> update running estimate, move target up / down
+    3. should_stop()   -> True once the estimate is stable or the bank is used up
+    """
+
+    def __init__(
+        self,
+        questions: Sequence[Question],
+        index: Dict[int, List[int]],
+        start_rank: int = 0,
+        min_questions: int = ADAPTIVE_MIN_QUESTIONS,
+        tolerance: float = ADAPTIVE_STOP_TOLERANCE,
+    ) -> None:
+        self.questions = questions
+        self.remaining: Dict[int, List[int]] = {r: list(p) for r, p in index.items() if p}
+        self.target = start_rank
+        self.min_questions = min_questions
+        self.tolerance = tolerance
+        self.scores: List[float] = []
+
+    # ------------------------------------------------------------------
+    # SELECTION
+    # ------------------------------------------------------------------
+    def next_question(self) -> Optional[Tuple[int, Question]]:
+        """Pop the next question at (or nearest to) the target difficulty."""
+        if not self.remaining:
+            return None
+
+        # Nearest rank wins; ties go to the easier one
+        rank = min(self.remaining, key=lambda r: (abs(r - self.target), r))
+        positions = self.remaining[rank]
+        pos = positions.pop(0)
+        if not positions:
+            del self.remaining[rank]
+
+        return pos, self.questions[pos]
+
+    def record(self, score: float) -> None:
+        """Add a per-question score and adjust the target difficulty."""
+        self.scores.append(score)
+
+        if score >= ADAPTIVE_PROMOTE_SCORE:
+            self.target += 1
+        elif score < ADAPTIVE_DEMOTE_SCORE:
+            self.target -= 1
+
+        ranks = DIFFICULTY_RANKS.values()
+        self.target = max(min(ranks), min(self.target, max(ranks)))
+
+    # ------------------------------------------------------------------
+    # EARLY STOPPING
+    # ------------------------------------------------------------------
+    @property
+    def asked(self) -> int:
+        return len(self.scores)
+
+    @property
+    def estimate(self) -> float:
+        """Mean per-question score so far."""
+        return sum(self.scores) / len(self.scores) if self.scores else 0.0
+
+    @property
+    def standard_error(self) -> float:
+        n = len(self.scores)
+        if n < 2:
+            return math.inf
+        mean = self.estimate
+        variance = sum((s - mean) ** 2 for s in self.scores) / (n - 1)
+        return math.sqrt(variance / n)
+
+    def should_stop(self) -> bool:
+        if not self.remaining:
+            return True
+        if self.asked < self.min_questions:
+            return False
+        return self.standard_error <= self.tolerance
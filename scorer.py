@@ -4,11 +4,12 @@ scorer.py
 Scoring and analysis utilities:
 - knowledge_score
 - confidence_score
-- analyze_answer (checks against expected keywords)
+- hesitation_count
+- analyze_answer (checks against expected keywords and ideal-answer similarity)
 """
 
-from typing import List, Optional, Tuple
-from config import HESITATION_WORDS
+from typing import List, Optional, Sequence, Tuple
+from config import HESITATION_WORDS, SIMILARITY_STRONG, SIMILARITY_PARTIAL
 
 
 def knowledge_score(answer: str) -> float:
@@ -32,15 +33,25 @@ def knowledge_score(answer: str) -> float:
     return max(0.0, length_score + keyword_score + clarity_penalty)
 
 
+def hesitation_count(answer: str) -> int:
+    """Number of hesitation markers (um, uh, maybe, ...) in the answer."""
+    answer_lower = answer.lower()
+    return sum(answer_lower.count(w) for w in HESITATION_WORDS)
+
+
+def speaking_pace(answer: str, duration: float) -> float:
+    """Words per second (durations under 1 second count as 1 second)."""
+    return len(answer.split()) / max(duration, 1.0)
+
+
 def confidence_score(answer: str, duration: float) -> float:
     """
     Confidence score:
     - penalizes hesitation words
     - penalizes speaking too slow or too fast
     """
-    answer_lower = answer.lower()
-    hesitations = sum(answer_lower.count(w) for w in HESITATION_WORDS)
-    pace = len(answer.split()) / max(duration, 1.0)  # words per second
+    hesitations = hesitation_count(answer)
+    pace = speaking_pace(answer, duration)
 
     score = 10 - hesitations
 
@@ -54,12 +65,21 @@ def confidence_score(answer: str, duration: float) -> float:
 
 def analyze_answer(
     answer: str,
-    expected_keywords: Optional[List[str]] = None,
+    expected_keywords: Optional[Sequence[str]] = None,
     ideal_answer: Optional[str] = None,
+    similarity: Optional[float] = None,
+    keywords_lower: Optional[Sequence[str]] = None,
 ) -> Tuple[str, List[str], str]:
     """
     Compare the answer content with expected keywords and produce feedback.
 
+    `similarity` is the TF-IDF cosine between the answer and the ideal answer
+    (see similarity.py). A high similarity upgrades the keyword verdict, so a
+    correct answer in the candidate's own words is not marked as weak.
+
+    `keywords_lower` may carry precomputed lowercase forms of the keywords
+    (Question.keywords_lower) to skip lowercasing them on every answer.
+
     Returns:
         verdict: 'strong', 'partial', 'weak', or 'no_answer'
         missing_keywords: list[str]
@@ -74,8 +94,10 @@ def analyze_answer(
 
     if expected_keywords:
         lower_ans = answer_clean.lower()
-        matched = [k for k in expected_keywords if k.lower() in lower_ans]
-        missing = [k for k in expected_keywords if k.lower() not in lower_ans]
+        lowered = keywords_lower or [k.lower() for k in expected_keywords]
+        hits = [k in lower_ans for k in lowered]
+        matched = [k for k, hit in zip(expected_keywords, hits) if hit]
+        missing = [k for k, hit in zip(expected_keywords, hits) if not hit]
 
         coverage = len(matched) / len(expected_keywords) if expected_keywords else 0.0
 
@@ -86,6 +108,8 @@ def analyze_answer(
         else:
             verdict = "weak"
 
+        verdict = _upgrade_by_similarity(verdict, similarity, answer_clean)
+
         feedback_parts = []
 
         if verdict == "strong":
@@ -106,9 +130,38 @@ def analyze_answer(
         feedback = " ".join(feedback_parts)
         return verdict, missing, feedback
 
+    if ideal_answer and similarity is not None:
+        verdict = _upgrade_by_similarity("weak", similarity, answer_clean)
+        if verdict == "strong":
+            feedback = "Good answer. It matches the key ideas of a model answer."
+        elif verdict == "partial":
+            feedback = "Decent answer, but a model answer covers more of the key ideas."
+        else:
+            feedback = "Your answer is missing several key ideas the interviewer expects."
+        return verdict, [], feedback + " A concise way to answer is: " + ideal_answer
+
     # No structured expectations
     feedback = (
         "Thanks for your answer. I don't have a strict checklist for this question, "
         "but try to be clear, structured, and give concrete examples."
     )
-    return "partial", [], feedback
\ No newline at end of file
+    return "partial", [], feedback
+
+
+def _admits_not_knowing(answer: str) -> bool:
+    answer_lower = answer.lower().replace("\u2019", "'")
+    return any(p in answer_lower for p in ("don't know", "dont know", "do not know"))
+
+
+def _upgrade_by_similarity(verdict: str, similarity: Optional[float], answer: str) -> str:
+    """
+    Raise a verdict to what the ideal-answer similarity alone would justify.
+    An answer that admits not knowing is never upgraded.
+    """
+    if similarity is None or _admits_not_knowing(answer):
+        return verdict
+    if similarity >= SIMILARITY_STRONG:
+        return "strong"
+    if similarity >= SIMILARITY_PARTIAL and verdict == "weak":
+        return "partial"
+    return verdict
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+similarity.py
+
+IdealAnswerIndex:
+- TF-IDF vectors (unigrams + bigrams) for every ideal_answer in a bank,
+  minus the terms of its own question
+- Built once per bank snapshot (see bank_loader) and stored as a compact CSR matrix (NumPy arrays)
+- Scoring an answer is a single sparse dot product against one row
+- score_all() scores an answer against every row at once (batch regrading)
+"""
+
+import re
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Filler words that would otherwise make unrelated answers look similar
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have in into is it its of on or "
+    "so that the their them then there these this to was we were with you your".split()
+)
+
+
+_SUFFIXES = ("ing", "ed", "es", "s")
+
+
+def _stem(token: str) -> str:
+    """Very light suffix stripping so 'labels' matches 'labeled'."""
+    for suffix in _SUFFIXES:
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[:-len(suffix)]
+    return token
+
+
+def terms(text: str) -> List[str]:
+    """Lowercased, lightly stemmed unigrams and bigrams, with stopwords removed."""
+    tokens = [_stem(t) for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def _term_counts(text: str) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for term in terms(text):
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+class IdealAnswerIndex:
+    """
+    Row i of the matrix is the L2-normalized TF-IDF vector of ideal_answers[i]
+    (an empty row if that question has no ideal answer).
+
+    Terms that also appear in question i are left out of row i and of the
+    answer vector it is compared with, so repeating the question back does
+    not count as similarity.
+    """
+
+    def __init__(self, pairs: Sequence[Tuple[str, Optional[str]]]) -> None:
+        question_terms = [set(terms(question or "")) for question, _ in pairs]
+        docs = []
+        for asked, (_, ideal) in zip(question_terms, pairs):
+            counts = _term_counts(ideal) if ideal else {}
+            docs.append({t: c for t, c in counts.items() if t not in asked})
+
+        # Vocabulary + smoothed IDF (question terms are in the vocabulary so
+        # they can be removed from the answer's norm)
+        doc_freq: Dict[str, int] = {}
+        for counts in docs:
+            for term in counts:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        n_docs = len(docs)
+        vocab_terms = sorted(set(doc_freq).union(*question_terms))
+        self.vocab: Dict[str, int] = {term: col for col, term in enumerate(vocab_terms)}
+        self.idf = np.array(
+            [math.log((1 + n_docs) / (1 + doc_freq.get(t, 0))) + 1.0 for t in vocab_terms],
+            dtype=np.float64,
+        )
+        # IDF for terms never seen in any ideal answer (they still count toward the norm)
+        self.unseen_idf = math.log(1 + n_docs) + 1.0
+
+        # CSR matrix of ideal answers
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for counts in docs:
+            row = sorted(
+                (self.vocab[t], c * float(self.idf[self.vocab[t]])) for t, c in counts.items()
+            )
+            norm = math.sqrt(sum(w * w for _, w in row)) or 1.0
+            indices.extend(col for col, _ in row)
+            data.extend(w / norm for _, w in row)
+            indptr.append(len(indices))
+
+        self.indptr = np.array(indptr, dtype=np.int32)
+        self.indices = np.array(indices, dtype=np.int32)
+        self.data = np.array(data, dtype=np.float32)
+        # Row id for every stored value, so score_all is one bincount
+        self._rows = np.repeat(np.arange(n_docs, dtype=np.int32), np.diff(self.indptr))
+
+        # CSR pattern of each row's question terms (excluded from the answer)
+        q_indptr = np.cumsum([0] + [len(t) for t in question_terms])
+        self.q_indptr = q_indptr.astype(np.int32)
+        self.q_indices = np.array(
+            [self.vocab[t] for asked in question_terms for t in sorted(asked)], dtype=np.int32
+        )
+        self._q_rows = np.repeat(np.arange(n_docs, dtype=np.int32), np.diff(self.q_indptr))
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def _query(self, answer: str) -> Tuple[np.ndarray, float]:
+        """Dense TF-IDF weights of the answer over the vocabulary, and their full squared norm."""
+        query = np.zeros(len(self.vocab), dtype=np.float64)
+        norm_sq = 0.0
+        for term, count in _term_counts(answer).items():
+            col = self.vocab.get(term)
+            weight = count * (float(self.idf[col]) if col is not None else self.unseen_idf)
+            norm_sq += weight * weight
+            if col is not None:
+                query[col] = weight
+        return query, norm_sq
+
+    def score(self, answer: str, row: int) -> float:
+        """Cosine similarity between the answer and ideal answer `row` (question terms excluded)."""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        if start == end:
+            return 0.0
+        query, norm_sq = self._query(answer)
+        asked = query[self.q_indices[self.q_indptr[row]:self.q_indptr[row + 1]]]
+        norm_sq -= float(np.dot(asked, asked))
+        if norm_sq <= 1e-12:
+            return 0.0
+        dot = float(np.dot(self.data[start:end], query[self.indices[start:end]]))
+        return dot / math.sqrt(norm_sq)
+
+    def score_all(self, answer: str) -> np.ndarray:
+        """Cosine similarity between the answer and every ideal answer in the bank."""
+        query, norm_sq = self._query(answer)
+        dots = np.bincount(self._rows, weights=self.data * query[self.indices], minlength=len(self))
+        asked = np.bincount(self._q_rows, weights=query[self.q_indices] ** 2, minlength=len(self))
+        remaining = norm_sq - asked
+        safe = np.where(remaining > 1e-12, remaining, 1.0)
+        return np.where(remaining > 1e-12, dots / np.sqrt(safe), 0.0).astype(np.float32)
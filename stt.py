@@ -0,0 +1,62 @@
+"""
+stt.py
+
+Speech-to-text helpers shared by JarvisVoice and loadtest.WavVoice:
+- Vosk model location
+- Feeding PCM to a KaldiRecognizer in memoryview slices
+Imports nothing from the audio stack (sounddevice / pyttsx3), so offline
+tools can decode WAV files on machines without PortAudio.
+"""
+
+import json
+from typing import Any, List
+
+try:
+    # Raw bindings, so PCM can be handed to Vosk without copying it into bytes
+    from vosk import _c as _vosk_lib, _ffi as _vosk_ffi
+except ImportError:
+    _vosk_lib = _vosk_ffi = None
+
+from config import RECOGNIZER_CHUNK_BYTES
+
+
+MODEL_DIR_NAME = "models/vosk-model-small-en-us"  # adjust if your folder name is different
+
+
+def feed(recognizer: Any, data: memoryview) -> List[str]:
+    """
+    Feed PCM to the recognizer in memoryview slices.
+    Returns the text of every utterance Vosk finalized along the way.
+
+    KaldiRecognizer.AcceptWaveform passes its argument to a cffi `char *`,
+    which rejects memoryview, so slices go through ffi.from_buffer() and the
+    C call directly (no copy). Without the raw bindings each chunk is copied.
+    """
+    handle = getattr(recognizer, "_handle", None)
+    parts: List[str] = []
+    for start in range(0, len(data), RECOGNIZER_CHUNK_BYTES):
+        chunk = data[start:start + RECOGNIZER_CHUNK_BYTES]
+        try:
+            if _vosk_lib is not None and handle is not None:
+                # Release the cffi view before the memoryview slice
+                with _vosk_ffi.from_buffer(chunk) as buf:
+                    accepted = _vosk_lib.vosk_recognizer_accept_waveform(
+                        handle, buf, len(chunk)
+                    )
+                if accepted < 0:
+                    raise RuntimeError("Failed to process waveform")
+            else:
+                accepted = recognizer.AcceptWaveform(chunk.tobytes())
+        finally:
+            chunk.release()
+
+        if accepted:
+            parts.append(json.loads(recognizer.Result()).get("text", ""))
+    return parts
+
+
+def transcribe(recognizer: Any, data: memoryview) -> str:
+    """All recognized text for `data`, including the final partial utterance."""
+    parts = feed(recognizer, data)
+    parts.append(json.loads(recognizer.FinalResult()).get("text", ""))
+    return " ".join(p for p in parts if p).strip()
@@ -0,0 +1,98 @@
+"""
+Tests for analytics: exact means, interpolated percentiles, calibration
+that ignores sampling noise, and tolerance for non-session JSON lines.
+"""
+
+import os
+import sys
+import json
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import CohortAnalytics  # noqa: E402
+
+
+LEVELS = ("fresher", "intermediate", "professional")
+QUESTIONS = [(f"Question {i}?", LEVELS[i % 3]) for i in range(23)]
+
+
+def _sessions(seed, strong_rate=None, count=3000):
+    """Random sessions; `strong_rate` maps a question to its own strong probability."""
+    rng = random.Random(seed)
+    strong_rate = strong_rate or {}
+    for _ in range(count):
+        answers = []
+        for question, difficulty in rng.sample(QUESTIONS, 5):
+            p = strong_rate.get(question)
+            if p is None:
+                verdict = rng.choice(("strong", "partial", "weak", "no_answer"))
+            else:
+                verdict = "strong" if rng.random() < p else "weak"
+            answers.append({
+                "question": question,
+                "difficulty": difficulty,
+                "verdict": verdict,
+                "knowledge": rng.uniform(0, 10),
+                "confidence": rng.uniform(0, 10),
+                "hesitations": rng.randint(0, 5),
+                "pace": rng.uniform(0, 4),
+                "missing": [],
+            })
+        yield {
+            "career": "python",
+            "level": "fresher",
+            "bank_key": "python",
+            "final_score": rng.uniform(0, 100),
+            "answers": answers,
+        }
+
+
+def _analyze(tmp_path, lines):
+    path = tmp_path / "sessions.jsonl"
+    with open(path, "w", encoding="utf-8") as fh:
+        for line in lines:
+            fh.write((line if isinstance(line, str) else json.dumps(line)) + "\n")
+    analytics = CohortAnalytics()
+    for chunk in analytics.read_chunks([str(path)], 500):
+        analytics.add(chunk)
+    return analytics
+
+
+def test_non_session_lines_are_skipped(tmp_path):
+    session = next(_sessions(1, count=1))
+    analytics = _analyze(tmp_path, ["[1, 2]", '"text"', "null", "{torn", session])
+    assert analytics.sessions == 1
+    assert analytics.answers == 5
+
+
+def test_means_are_exact_and_percentiles_interpolated(tmp_path):
+    sessions = list(_sessions(1))
+    analytics = _analyze(tmp_path, sessions)
+    row = analytics.distributions()[0]
+    answers = [a for s in sessions for a in s["answers"]]
+
+    assert row["pace_mean"] == pytest.approx(sum(a["pace"] for a in answers) / len(answers), abs=0.005)
+    assert row["hesitations_mean"] == pytest.approx(
+        sum(a["hesitations"] for a in answers) / len(answers), abs=0.005
+    )
+    # uniform(0, 4): p10 = 0.4, p90 = 3.6
+    assert row["pace_p10"] == pytest.approx(0.4, abs=0.05)
+    assert row["pace_p90"] == pytest.approx(3.6, abs=0.05)
+
+    scores = analytics.score_percentiles()[0]
+    assert scores["mean"] == pytest.approx(sum(s["final_score"] for s in sessions) / len(sessions), abs=0.005)
+
+
+def test_calibration_ignores_noise(tmp_path):
+    flagged = [r for r in _analyze(tmp_path, _sessions(1)).calibration() if r["flag"]]
+    assert flagged == []
+
+
+def test_calibration_flags_real_outlier(tmp_path):
+    # A fresher question nobody answers well
+    analytics = _analyze(tmp_path, _sessions(1, strong_rate={"Question 0?": 0.05}))
+    flags = {r["question"]: r["flag"] for r in analytics.calibration() if r["flag"]}
+    assert flags == {"Question 0?": "harder than labelled"}
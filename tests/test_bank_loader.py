@@ -0,0 +1,80 @@
+"""
+Tests for bank_loader: a bad bank file must never drop the live snapshot
+or stop the background watcher.
+"""
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bank_loader  # noqa: E402
+from bank_loader import BankLoader  # noqa: E402
+
+
+GOOD_BANK = [
+    {
+        "question": "What is Docker?",
+        "keywords": ["container", "image"],
+        "ideal_answer": "Docker packages applications into containers.",
+        "difficulty": "fresher",
+    }
+]
+
+
+def _write(path, data):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh)
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_bad_field_types_keep_previous_snapshot(tmp_path):
+    _write(tmp_path / "devops.json", GOOD_BANK)
+    loader = BankLoader(str(tmp_path), poll_interval=0.05)
+    before = loader.current()
+    assert "devops" in before.banks
+
+    _write(tmp_path / "devops.json", [{"question": "q?", "keywords": [1, 2], "difficulty": 3}])
+    assert loader.reload() is False
+    assert loader.current() is before
+
+
+def test_bad_file_at_startup_falls_back_to_config(tmp_path):
+    _write(tmp_path / "broken.json", [{"question": "q?", "keywords": [1, 2]}])
+    loader = BankLoader(str(tmp_path), poll_interval=0.05)
+    assert "broken" not in loader.current().banks
+    assert "python" in loader.current().banks
+
+
+def test_watcher_survives_failed_rebuild(tmp_path, monkeypatch):
+    loader = BankLoader(str(tmp_path), poll_interval=0.05)
+    before = loader.current()
+    loader.start()
+    try:
+        real_build = bank_loader.build_snapshot
+
+        def failing_build(sequence, banks_dir):
+            raise TypeError("boom")
+
+        monkeypatch.setattr(bank_loader, "build_snapshot", failing_build)
+        _write(tmp_path / "devops.json", GOOD_BANK)
+        assert _wait_for(lambda: loader._fingerprint == loader._scan())
+        assert loader.current() is before
+        assert loader._thread.is_alive()
+
+        # A later change is still picked up once building works again
+        monkeypatch.setattr(bank_loader, "build_snapshot", real_build)
+        _write(tmp_path / "devops.json", GOOD_BANK + GOOD_BANK)
+        assert _wait_for(lambda: len(loader.current().banks.get("devops", ())) == 2)
+    finally:
+        loader.stop()
@@ -0,0 +1,65 @@
+"""
+Tests for enrichment: scraped advice text must not become the reference
+answer or the keywords, and a bad page must not stop the worker.
+"""
+
+import os
+import sys
+import json
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import enrichment  # noqa: E402
+from enrichment import BankEnricher, build_bank  # noqa: E402
+
+
+SECTIONS = [
+    (
+        "How do you prioritize your work?",
+        "Interviewers ask this question to assess your planning skills and how managers "
+        "can understand your workflow. Example answer: \"I start each week by listing "
+        "deadlines and estimating effort for every task. I then rank tasks by urgency and "
+        "impact.\" Hiring managers like concrete habits.",
+    ),
+    (
+        "Why do you want this job?",
+        "Employers want to understand your motivation. Talk about the company mission "
+        "and the product.",
+    ),
+]
+
+
+def test_ideal_answer_comes_from_example_block():
+    with_example, without_example = build_bank(SECTIONS)
+    assert with_example["ideal_answer"] == (
+        "I start each week by listing deadlines and estimating effort for every task. "
+        "I then rank tasks by urgency and impact."
+    )
+    assert without_example["ideal_answer"] is None
+
+
+def test_keywords_skip_interview_filler():
+    for item in build_bank(SECTIONS):
+        assert not {"assess", "skills", "managers", "understand"} & set(item["keywords"])
+
+
+def test_worker_survives_unexpected_errors(tmp_path, monkeypatch):
+    real_build = enrichment.build_bank
+
+    def failing_build(sections):
+        raise ValueError("bad page")
+
+    monkeypatch.setattr(enrichment, "build_bank", failing_build)
+    enricher = BankEnricher(str(tmp_path))
+    enricher.submit("broken", SECTIONS)
+
+    finished = threading.Event()
+    threading.Thread(target=lambda: (enricher.join(), finished.set()), daemon=True).start()
+    assert finished.wait(3.0)
+
+    monkeypatch.setattr(enrichment, "build_bank", real_build)
+    enricher.submit("careers", SECTIONS)
+    enricher.join()
+    with open(tmp_path / "careers.json", encoding="utf-8") as fh:
+        assert len(json.load(fh)) == 2
@@ -0,0 +1,54 @@
+"""
+Tests for loadtest: the harness must run on a headless box without the
+audio stack (sounddevice / pyttsx3), including the --wav-dir path.
+"""
+
+import os
+import sys
+import json
+import types
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _FakeRecognizer:
+    """Minimal KaldiRecognizer that reports how many bytes it was fed."""
+
+    def __init__(self, model, sample_rate):
+        self.fed = 0
+
+    def AcceptWaveform(self, data):
+        self.fed += len(data)
+        return False
+
+    def Result(self):
+        return json.dumps({"text": ""})
+
+    def FinalResult(self):
+        return json.dumps({"text": f"{self.fed} bytes"})
+
+
+def test_wav_mode_without_audio_stack(tmp_path, monkeypatch):
+    # None in sys.modules makes any import of these fail, like a box without PortAudio
+    monkeypatch.setitem(sys.modules, "sounddevice", None)
+    monkeypatch.setitem(sys.modules, "pyttsx3", None)
+    fake_vosk = types.ModuleType("vosk")
+    fake_vosk.Model = lambda path: object()
+    fake_vosk.KaldiRecognizer = _FakeRecognizer
+    monkeypatch.setitem(sys.modules, "vosk", fake_vosk)
+    for name in ("stt", "voice", "interview", "loadtest"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    import loadtest
+
+    path = tmp_path / "answer.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\0\0" * 16000)
+
+    voice = loadtest.WavVoice([str(path)], speedup=1000.0)
+    assert voice.listen() == "32000 bytes"
+    assert "voice" not in sys.modules
@@ -0,0 +1,137 @@
+"""
+Tests for scheduler: target movement, nearest-rank selection, the
+min-question floor and the standard-error stop, plus the score projection
+InterviewBot applies when a session stops early.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ADAPTIVE_DEMOTE_SCORE, ADAPTIVE_MIN_QUESTIONS, ADAPTIVE_PROMOTE_SCORE  # noqa: E402
+from questions import Question  # noqa: E402
+from scheduler import AdaptiveScheduler, build_difficulty_index  # noqa: E402
+
+
+LABELS = ("fresher", "intermediate", "professional")
+# Two questions per rank, interleaved so bank order differs from rank order
+BANK = tuple(
+    Question.create(f"{label} {i}?", difficulty=label) for i in range(2) for label in LABELS
+)
+HIGH = ADAPTIVE_PROMOTE_SCORE + 1.0
+MID = (ADAPTIVE_PROMOTE_SCORE + ADAPTIVE_DEMOTE_SCORE) / 2
+LOW = ADAPTIVE_DEMOTE_SCORE - 1.0
+
+
+def _scheduler(start_rank=0, **kwargs):
+    return AdaptiveScheduler(BANK, build_difficulty_index(BANK), start_rank=start_rank, **kwargs)
+
+
+def _label(picked):
+    return picked[1].difficulty
+
+
+def test_index_groups_positions_by_rank_in_bank_order():
+    assert build_difficulty_index(BANK) == {0: [0, 3], 1: [1, 4], 2: [2, 5]}
+
+
+def test_high_scores_promote_and_low_scores_demote():
+    s = _scheduler()
+    assert _label(s.next_question()) == "fresher"
+    s.record(HIGH)
+    assert _label(s.next_question()) == "intermediate"
+    s.record(HIGH)
+    assert _label(s.next_question()) == "professional"
+    s.record(HIGH)  # already at the top: target stays clamped
+    assert s.target == 2
+    s.record(LOW)
+    assert _label(s.next_question()) == "intermediate"
+    s.record(MID)  # between the thresholds: target unchanged
+    assert s.target == 1
+
+
+def test_nearest_rank_prefers_easier_on_ties():
+    s = _scheduler(start_rank=1)
+    # Use up both intermediate questions
+    s.next_question()
+    s.next_question()
+    # Fresher and professional are equally near; the easier one wins
+    assert _label(s.next_question()) == "fresher"
+
+
+def test_never_stops_before_min_questions():
+    s = _scheduler(min_questions=ADAPTIVE_MIN_QUESTIONS, tolerance=100.0)
+    for _ in range(ADAPTIVE_MIN_QUESTIONS - 1):
+        s.next_question()
+        s.record(MID)
+        assert not s.should_stop()
+    s.next_question()
+    s.record(MID)
+    assert s.should_stop()
+
+
+def test_stops_once_standard_error_within_tolerance():
+    s = _scheduler(min_questions=2, tolerance=1.0)
+    for score in (2.0, 18.0):
+        s.next_question()
+        s.record(score)
+    assert s.standard_error == pytest.approx(8.0)
+    assert not s.should_stop()
+
+    for score in (10.0, 10.0, 10.0):
+        s.next_question()
+        s.record(score)
+    # scores 2, 18, 10, 10, 10 -> SE = sqrt(32 / 5) ~ 2.53, still above 1.0
+    assert s.standard_error == pytest.approx((32 / 5) ** 0.5)
+    assert not s.should_stop()
+
+    s.next_question()  # last question: bank exhausted
+    s.record(10.0)
+    assert s.should_stop()
+
+
+def test_consistent_scores_stop_at_the_floor():
+    s = _scheduler(min_questions=3, tolerance=1.5)
+    for score in (8.0, 9.0, 8.5):
+        s.next_question()
+        s.record(score)
+    assert s.standard_error == pytest.approx(0.2887, abs=1e-4)
+    assert s.should_stop()
+    assert s.estimate == pytest.approx(8.5)
+
+
+class _SilentVoice:
+    recorder = None
+    sample_rate = 16000
+
+    def speak(self, text):
+        pass
+
+
+def test_early_stop_projects_totals_to_full_bank():
+    from interview import InterviewBot
+
+    bot = InterviewBot("python", "fresher", voice=_SilentVoice(), record=False, save_results=False)
+    n = len(bot.questions)
+    assert n > 1
+    bot.questions_asked = 1
+    bot.total_knowledge = 10.0
+    bot.total_confidence = 5.0
+
+    knowledge, confidence, final = bot._summarize_results()
+    assert knowledge == pytest.approx(10.0 * n)
+    assert confidence == pytest.approx(5.0 * n)
+    assert final == pytest.approx(0.7 * 10.0 * n + 0.3 * 5.0 * n)
+
+
+def test_full_session_is_not_projected():
+    from interview import InterviewBot
+
+    bot = InterviewBot("python", "fresher", voice=_SilentVoice(), record=False, save_results=False)
+    bot.questions_asked = len(bot.questions)
+    bot.total_knowledge = 20.0
+    bot.total_confidence = 10.0
+    assert bot._summarize_results() == pytest.approx((20.0, 10.0, 17.0))
@@ -0,0 +1,158 @@
+"""
+Tests for similarity: the ideal-answer cosine must reward paraphrasing the
+answer, not repeating the question.
+
+Two labelled sets:
+- TUNING: the answers SIMILARITY_STRONG / SIMILARITY_PARTIAL were chosen on.
+  Checking them is a regression fixture for the chosen values, not evidence
+  that the values generalize.
+- HELD_OUT: written after the thresholds were fixed, on questions TUNING
+  does not use, and never used to tune them. When the thresholds were set
+  (0.45 / 0.10): 8/8 non-answers stayed below PARTIAL, 8/8 strong answers
+  reached PARTIAL, and 7/8 partial answers stayed below STRONG.
+
+"strong" answers are only required to reach PARTIAL: STRONG is deliberately
+conservative (5 of 12 strong TUNING answers and 3 of 8 HELD_OUT reach it), since
+similarity only ever upgrades the keyword verdict.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SIMILARITY_PARTIAL, SIMILARITY_STRONG, STRUCTURED_QUESTIONS  # noqa: E402
+from scorer import analyze_answer  # noqa: E402
+from similarity import IdealAnswerIndex  # noqa: E402
+
+
+# (bank, question index, answer, label)
+TUNING = [
+    ("python", 0, "Lists can be modified after you create them, you can append or remove items, they use square brackets. Tuples use parentheses and are immutable so you cannot change them.", "strong"),
+    ("python", 0, "A list is mutable and a tuple is immutable.", "partial"),
+    ("python", 0, "A list in Python is different from a tuple in Python.", "non"),
+    ("python", 0, "I don't know, I have never used a list or a tuple in Python.", "non"),
+    ("python", 1, "It maps keys to values, you look things up by key rather than by index, written with curly braces.", "strong"),
+    ("python", 1, "It stores key value pairs.", "partial"),
+    ("python", 1, "A dictionary is a dictionary in Python, it is like a dictionary.", "non"),
+    ("python", 2, "It isolates the dependencies of each project from the global installation so package versions don't conflict between projects.", "strong"),
+    ("python", 2, "It keeps dependencies separate.", "partial"),
+    ("python", 2, "We use a virtual environment in Python because it is a virtual environment.", "non"),
+    ("aiml", 0, "You train a model on labeled data so it can make predictions, for example classification or regression.", "strong"),
+    ("aiml", 0, "The training data has labels.", "partial"),
+    ("aiml", 0, "Supervised learning is learning that is supervised.", "non"),
+    ("aiml", 2, "The model memorizes noise in the training data and then performs poorly on unseen data, so it does not generalize.", "strong"),
+    ("aiml", 2, "It does well on training data but badly on new data.", "partial"),
+    ("aiml", 2, "I don't know what overfitting in machine learning is.", "non"),
+    ("aiml", 3, "Classification predicts discrete labels or classes while regression predicts continuous numeric values like prices.", "strong"),
+    ("aiml", 3, "One predicts categories and the other predicts numbers.", "partial"),
+    ("aiml", 3, "The difference between classification and regression is that they are different.", "non"),
+    ("dsa", 0, "Arrays sit in contiguous memory so random indexing is fast, linked lists connect nodes with pointers so insertions and deletions are easier but access is slower.", "strong"),
+    ("dsa", 0, "Linked lists use pointers between nodes.", "partial"),
+    ("dsa", 0, "An array is an array and a linked list is a list that is linked.", "non"),
+    ("dsa", 1, "It runs in O(log n) time and needs the collection to be sorted, it keeps dividing the range in half.", "strong"),
+    ("dsa", 1, "It needs sorted data.", "partial"),
+    ("dsa", 1, "Binary search has a time complexity and you can use it when you search.", "non"),
+    ("dsa", 2, "A LIFO data structure, last in first out, you push and pop from the top, like a pile of plates.", "strong"),
+    ("dsa", 2, "You push and pop elements.", "partial"),
+    ("dsa", 2, "Um, I am not sure, maybe a stack is a real-world example.", "non"),
+    ("datascience", 0, "Two variables moving together does not mean one directly causes changes in the other.", "strong"),
+    ("datascience", 0, "Variables move together.", "partial"),
+    ("datascience", 0, "Correlation is correlation and causation is causation, that is the difference.", "non"),
+    ("webdev", 1, "The website adapts its layout to different screen sizes and devices using flexible layouts and media queries.", "strong"),
+    ("webdev", 1, "It works on different screen sizes.", "partial"),
+    ("webdev", 1, "Responsive design is a design that is responsive.", "non"),
+    ("cybersecurity", 1, "It converts readable data into an unreadable format with an algorithm and a key so only someone with the key can decrypt it.", "strong"),
+    ("cybersecurity", 1, "It makes data unreadable without a key.", "partial"),
+    ("cybersecurity", 1, "I have heard of encryption but I do not know what encryption is.", "non"),
+]
+
+# Never used for tuning; kept on different questions than TUNING
+HELD_OUT = [
+    ("aiml", 1, "There are no labels, the algorithm finds structure on its own, for example grouping similar points into clusters.", "strong"),
+    ("aiml", 1, "It finds clusters.", "partial"),
+    ("aiml", 1, "Unsupervised learning is learning without supervision.", "non"),
+    ("dsa", 3, "A queue is first in first out, you add at the back and remove from the front, while a stack removes the most recently added element.", "strong"),
+    ("dsa", 3, "It is FIFO.", "partial"),
+    ("dsa", 3, "A queue is different from a stack because a queue is a queue.", "non"),
+    ("datascience", 1, "You rescale features to a similar range with normalization or standardization so gradient descent converges faster and big features don't dominate.", "strong"),
+    ("datascience", 1, "Normalizing the values.", "partial"),
+    ("datascience", 1, "I don't know why feature scaling is important.", "non"),
+    ("datascience", 2, "A table of true positives, true negatives, false positives and false negatives that shows how a classifier performs.", "strong"),
+    ("datascience", 2, "It counts false positives and false negatives.", "partial"),
+    ("datascience", 2, "A confusion matrix is a matrix that can be confusing.", "non"),
+    ("webdev", 0, "HTML gives the page its structure and content and CSS handles styling and the visual presentation.", "strong"),
+    ("webdev", 0, "CSS is for styling.", "partial"),
+    ("webdev", 0, "HTML and CSS are different, that is the difference between HTML and CSS.", "non"),
+    ("webdev", 2, "It lets software systems communicate, usually by sending HTTP requests and getting JSON responses back.", "strong"),
+    ("webdev", 2, "You send HTTP requests to it.", "partial"),
+    ("webdev", 2, "An API in web development is an API used in the context of web development.", "non"),
+    ("cybersecurity", 0, "Attackers send fake emails or messages to trick people into revealing passwords or credit card numbers.", "strong"),
+    ("cybersecurity", 0, "Fake emails that steal passwords.", "partial"),
+    ("cybersecurity", 0, "Hmm, phishing is maybe some kind of phishing.", "non"),
+    ("cybersecurity", 2, "It monitors and filters network traffic using security rules to block unauthorized access but allow legitimate communication.", "strong"),
+    ("cybersecurity", 2, "It filters network traffic.", "partial"),
+    ("cybersecurity", 2, "I do not know what a firewall is.", "non"),
+]
+
+INDEXES = {
+    key: IdealAnswerIndex([(q["question"], q.get("ideal_answer")) for q in bank])
+    for key, bank in STRUCTURED_QUESTIONS.items()
+}
+
+
+def _score(bank, row, answer):
+    return INDEXES[bank].score(answer, row)
+
+
+@pytest.mark.parametrize("bank,row,answer,label", TUNING)
+def test_tuning_set_regression(bank, row, answer, label):
+    similarity = _score(bank, row, answer)
+    if label == "non":
+        assert similarity < SIMILARITY_PARTIAL
+    elif label == "partial":
+        assert similarity < SIMILARITY_STRONG
+    else:
+        assert similarity >= SIMILARITY_PARTIAL
+
+
+def test_held_out_set():
+    by_label = {"strong": [], "partial": [], "non": []}
+    for bank, row, answer, label in HELD_OUT:
+        by_label[label].append(_score(bank, row, answer))
+
+    assert all(s < SIMILARITY_PARTIAL for s in by_label["non"])
+    assert all(s >= SIMILARITY_PARTIAL for s in by_label["strong"])
+    # Short, precise partial answers can legitimately look strong; allow a few
+    below = sum(s < SIMILARITY_STRONG for s in by_label["partial"])
+    assert below >= 0.75 * len(by_label["partial"])
+
+
+def test_strong_paraphrases_rank_above_non_answers():
+    labelled = TUNING + HELD_OUT
+    strong = [_score(b, r, a) for b, r, a, label in labelled if label == "strong"]
+    non = [_score(b, r, a) for b, r, a, label in labelled if label == "non"]
+    assert sorted(strong)[len(strong) // 2] > 4 * max(non)
+
+
+def test_repeating_the_question_scores_zero():
+    for key, bank in STRUCTURED_QUESTIONS.items():
+        for row, q in enumerate(bank):
+            assert _score(key, row, q["question"]) == 0.0
+
+
+def test_score_all_matches_score():
+    for bank, row, answer, _ in TUNING + HELD_OUT:
+        batch = INDEXES[bank].score_all(answer)
+        assert batch[row] == pytest.approx(_score(bank, row, answer), abs=1e-6)
+
+
+def test_dont_know_is_never_upgraded():
+    q = STRUCTURED_QUESTIONS["aiml"][3]
+    answer = "I don't know, one predicts discrete labels and the other continuous values"
+    verdict, _, _ = analyze_answer(answer, ["supervised"], q["ideal_answer"], 0.9)
+    assert verdict == "weak"
+    verdict, _, _ = analyze_answer(answer, None, q["ideal_answer"], 0.9)
+    assert verdict == "weak"
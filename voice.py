@@ -7,15 +7,16 @@ JarvisVoice:
 """
 
 import os
-import json
+import threading
+from typing import List, Optional
+
 import pyttsx3
 import sounddevice as sd
 from vosk import Model, KaldiRecognizer
 
 from config import TTS_RATE, TTS_VOLUME
-
-
-MODEL_DIR_NAME = "models/vosk-model-small-en-us"  # adjust if your folder name is different
+from recorder import SessionRecorder
+from stt import MODEL_DIR_NAME, transcribe
 
 
 class JarvisVoice:
@@ -38,6 +39,9 @@ class JarvisVoice:
 
         self.model = Model(model_path)
 
+        # Optional per-session recording (attached by InterviewBot)
+        self.recorder: Optional[SessionRecorder] = None
+
     def speak(self, text: str) -> None:
         """Speak text aloud and also print it."""
         print(f"Jarvis: {text}")
@@ -47,43 +51,84 @@ class JarvisVoice:
         except Exception as exc:
             print(f"[TTS Error] {exc}")
 
-    def listen(self, duration: float = 8.0) -> str:
+    def listen(self, duration: float = 8.0, question_index: Optional[int] = None) -> str:
         """
         Record from microphone for a fixed duration (in seconds)
         and return recognized text using Vosk.
+
+        If a SessionRecorder is attached, audio blocks are copied from the input
+        stream straight into the session's memory-mapped WAV file and the
+        recognizer reads them from there.
         """
         self.speak("Listening...")
 
+        frames = int(duration * self.sample_rate)
+
         try:
-            # Record audio
-            audio = sd.rec(
-                int(duration * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype="int16",
-            )
-            sd.wait()  # Wait until recording is finished
+            # Record audio (into the session recording when one is active)
+            if self.recorder is not None:
+                self._record_into(self.recorder, frames)
+            else:
+                audio = sd.rec(
+                    frames,
+                    samplerate=self.sample_rate,
+                    channels=1,
+                    dtype="int16",
+                )
+                sd.wait()  # Wait until recording is finished
         except Exception as exc:
+            if self.recorder is not None:
+                self.recorder.discard()
             print(f"[Audio Input Error] {exc}")
             self.speak("I could not access your microphone. Please check your audio settings.")
             return ""
 
-        # Convert to bytes for Vosk
-        data = audio.tobytes()
+        if self.recorder is not None:
+            data = self.recorder.commit(question_index if question_index is not None else -1)
+        else:
+            data = memoryview(audio).cast("B")
 
         # Recognize with Vosk
         try:
             recognizer = KaldiRecognizer(self.model, self.sample_rate)
-            if recognizer.AcceptWaveform(data):
-                result = recognizer.Result()
-            else:
-                result = recognizer.FinalResult()
-
-            result_json = json.loads(result)
-            text = result_json.get("text", "").strip()
+            text = transcribe(recognizer, data)
             print(f"[Recognized] {text}")
             return text
         except Exception as exc:
             print(f"[STT Error] {exc}")
             self.speak("I had trouble understanding your voice.")
             return ""
+        finally:
+            data.release()
+
+    def _record_into(self, recorder: SessionRecorder, frames: int) -> None:
+        """
+        Record `frames` samples through an InputStream callback that copies each
+        block into the recorder. sounddevice only ever sees its own buffers, so
+        nothing keeps the mapping exported after the stream closes.
+        """
+        remaining = [frames]
+        errors: List[BaseException] = []
+        done = threading.Event()
+
+        def callback(indata, count, time_info, status) -> None:
+            try:
+                take = min(count, remaining[0])
+                if take:
+                    recorder.append(indata[:take])
+                    remaining[0] -= take
+            except Exception as exc:
+                errors.append(exc)
+                done.set()
+                raise sd.CallbackAbort
+            if remaining[0] <= 0:
+                done.set()
+                raise sd.CallbackStop
+
+        with sd.InputStream(
+            samplerate=self.sample_rate, channels=1, dtype="int16", callback=callback
+        ):
+            if not done.wait(frames / self.sample_rate + 2.0):
+                raise RuntimeError("Timed out waiting for microphone input")
+        if errors:
+            raise errors[0]